@@ -0,0 +1,30 @@
+"""
+GRAE-X SENTINEL PRO - Launcher Banner
+Shared by grae_x_sentinel.py and grae_x_sentinel_fixed.py
+"""
+
+BANNER_ART = """
+    ╔══════════════════════════════════════════════════════════════╗
+    ║                                                              ║
+    ║    ██████╗ ██████╗  █████╗ ███████╗   ███████╗███████╗      ║
+    ║   ██╔════╝ ██╔══██╗██╔══██╗██╔════╝   ██╔════╝╚══███╔╝      ║
+    ║   ██║  ███╗██████╔╝███████║█████╗     █████╗    ███╔╝       ║
+    ║   ██║   ██║██╔══██╗██╔══██║██╔══╝     ██╔══╝   ███╔╝        ║
+    ║   ╚██████╔╝██║  ██║██║  ██║██║        ███████╗███████╗      ║
+    ║    ╚═════╝ ╚═╝  ╚═╝╚═╝  ╚═╝╚═╝        ╚══════╝╚══════╝      ║
+    ║                                                              ║
+    ║             S E N T I N E L   P R O   v4.0                   ║
+    ║      Complete Cybersecurity Suite - GUI & CLI                ║
+    ║                                                              ║
+    ╚══════════════════════════════════════════════════════════════╝
+    """
+
+# Colored pieces, built once at import
+_CYAN_BANNER = "\033[96m" + BANNER_ART + "\033[0m"
+_GREEN_RULE = "\033[92m" + "=" * 70 + "\033[0m"
+_YELLOW_TAGLINE = "\033[93m Advanced Password & WiFi Security Tool with Beautiful GUI \033[0m"
+
+# Fully assembled banner, encoded once at import time
+BANNER_BYTES = "\n".join(
+    (_CYAN_BANNER, _GREEN_RULE, _YELLOW_TAGLINE, _GREEN_RULE, "", "")
+).encode('utf-8')
@@ -0,0 +1,90 @@
+"""
+GRAE-X SENTINEL PRO - Module Import Checks
+Shared harness behind final_test.py (full) and quick_test.py (basic)
+"""
+
+import sys
+import functools
+import importlib
+from concurrent.futures import ThreadPoolExecutor
+
+TESTS = (
+    ("WiFiScanner", "wifi_scanner"),
+    ("BreachChecker", "breach_checker"),
+    ("PasswordGenerator", "password_generator"),
+    ("ReportGenerator", "report_generator"),
+)
+
+# Extra output for the full run, given an instance of the class
+DETAILS = {
+    "WiFiScanner": lambda scanner: [f"   Sample scan: {scanner.scan()[:1]}"],  # Show first network
+    "PasswordGenerator": lambda generator: [f"   Generated: {generator.generate()}"],
+}
+
+
+@functools.lru_cache(maxsize=None)
+def _imp(name):
+    """Import a module once per process (failed imports are not cached)"""
+    return importlib.import_module(name)
+
+
+def _preload():
+    """Start every import at once; results are still reported in order"""
+    with ThreadPoolExecutor(max_workers=len(TESTS)) as executor:
+        return [executor.submit(_imp, f"modules.{module_name}") for _, module_name in TESTS]
+
+
+def run_basic():
+    """Check that each module class can be imported"""
+    print("Testing basic imports...")
+    print("=" * 50)
+
+    for (class_name, module_name), future in zip(TESTS, _preload()):
+        try:
+            getattr(future.result(), class_name)
+            print(f" {class_name} imported successfully")
+        except Exception as e:
+            print(f" {class_name} failed: {e}")
+
+    print("=" * 50)
+
+
+def run_full():
+    """Import, instantiate and exercise each module class"""
+    _preload()
+
+    # Results are collected here and written in one go at the end; an error
+    # writes the buffered results plus itself immediately
+    out = ["=== Testing Module Imports ===", ""]
+
+    for class_name, module_name in TESTS:
+        try:
+            instance = getattr(_imp(f"modules.{module_name}"), class_name)()
+            out.append(f" {class_name}: Success")
+            out.extend(DETAILS.get(class_name, lambda _: [])(instance))
+        except Exception as e:
+            out.append(f" {class_name}: {type(e).__name__}: {e}")
+            sys.stdout.write("\n".join(out) + "\n")
+            sys.stdout.flush()
+            out.clear()
+        out.append("")
+
+    out.append("=" * 40)
+    sys.stdout.write("\n".join(out) + "\n")
+
+
+def main(argv=None):
+    """Entry point: --mode=basic|full (default full)"""
+    mode = "full"
+    for arg in sys.argv[1:] if argv is None else argv:
+        if arg.startswith("--mode="):
+            mode = arg.split("=", 1)[1]
+        else:
+            sys.exit(f"Unknown argument: {arg}")
+
+    if mode == "basic":
+        run_basic()
+    elif mode == "full":
+        run_full()
+    else:
+        sys.exit(f"Unknown mode: {mode} (choose basic or full)")
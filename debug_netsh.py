@@ -1,38 +1,80 @@
 ﻿import subprocess
 import platform
+import sys
+import os
+import time
+from collections import namedtuple
+
+# Reuse netsh output from a previous run (python debug_netsh.py --cache)
+USE_CACHE = "--cache" in sys.argv[1:]
+CACHE_MAX_AGE = 60  # seconds
+
+# A started netsh query: the running process, or None when cached holds
+# the output read from cache_file
+NetshQuery = namedtuple("NetshQuery", "proc cached cache_file")
+
+
+def read_cache(cache_file):
+    """Return cached netsh output if it is fresh enough, otherwise None"""
+    try:
+        if time.time() - os.path.getmtime(cache_file) < CACHE_MAX_AGE:
+            with open(cache_file, "r", encoding="utf-8") as f:
+                return f.read()
+    except OSError:
+        pass
+    return None
+
+
+def start_netsh(args, cache_file):
+    """Start a netsh wlan query without waiting for it (or hit the cache)"""
+    if USE_CACHE:
+        cached = read_cache(cache_file)
+        if cached is not None:
+            return NetshQuery(None, cached, cache_file)
+    proc = subprocess.Popen(
+        ["netsh", "wlan", "show", "networks", *args],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE
+    )
+    return NetshQuery(proc, None, cache_file)
+
+
+def finish_netsh(query):
+    """Wait for a netsh query and return (returncode, decoded stdout)"""
+    if query.proc is None:
+        return 0, query.cached
+    out, _ = query.proc.communicate()
+    stdout = out.decode("utf-8", "ignore")
+    if USE_CACHE and query.proc.returncode == 0:
+        with open(query.cache_file, "w", encoding="utf-8") as f:
+            f.write(stdout)
+    return query.proc.returncode, stdout
+
+
+# Launch both queries up front so their process startup and WLAN service
+# time overlap instead of running back to back
+bssid_query = start_netsh(["mode=bssid"], "netsh_cache_bssid.txt")
+simple_query = start_netsh([], "netsh_cache.txt")
 
 print("Testing netsh command parsing...")
 print("=" * 60)
 
-# Run netsh command
-result = subprocess.run(
-    ["netsh", "wlan", "show", "networks", "mode=bssid"],
-    capture_output=True,
-    text=True,
-    encoding="utf-8",
-    errors="ignore"
-)
-
-print(f"Return code: {result.returncode}")
-print(f"Output length: {len(result.stdout)} chars")
+returncode, stdout = finish_netsh(bssid_query)
+
+print(f"Return code: {returncode}")
+print(f"Output length: {len(stdout)} chars")
 print("\nFirst 500 characters of output:")
 print("-" * 40)
-print(result.stdout[:500])
+print(stdout[:500])
 print("-" * 40)
 
 # Also test simple command
 print("\n\nTesting simple netsh command...")
 print("=" * 60)
-result2 = subprocess.run(
-    ["netsh", "wlan", "show", "networks"],
-    capture_output=True,
-    text=True,
-    encoding="utf-8",
-    errors="ignore"
-)
-
-print(f"Return code: {result2.returncode}")
-print(f"Output length: {len(result2.stdout)} chars")
+returncode2, stdout2 = finish_netsh(simple_query)
+
+print(f"Return code: {returncode2}")
+print(f"Output length: {len(stdout2)} chars")
 print("\nFirst 500 characters of output:")
 print("-" * 40)
-print(result2.stdout[:500])
+print(stdout2[:500])
@@ -1,14 +1,8 @@
-# Create a quick patch file
-patch_code = '''
 # Quick patch for ReportGenerator
-import sys
-import os
+import re
+import mmap
 
-# Patch the sentinel_gui_fixed.py file
-with open('sentinel_gui_fixed.py', 'r') as f:
-    content = f.read()
-
-# Find and replace the problematic method calls
+# Problematic ReportGenerator calls and their dialog replacements
 replacements = {
     'self.report_generator.generate_wifi_report(self.current_networks)': 
     'messagebox.showinfo("WiFi Report", f"Found {len(self.current_networks) if self.current_networks else 0} networks")',
@@ -20,19 +14,38 @@ replacements = {
     'messagebox.showinfo("Dashboard", "System dashboard report generated")'
 }
 
-for old, new in replacements.items():
-    if old in content:
-        content = content.replace(old, new)
-        print(f"Replaced: {old[:50]}...")
+# Encoded view of the table so it can be matched against the raw file bytes
+byte_replacements = {old.encode('utf-8'): new.encode('utf-8') for old, new in replacements.items()}
+replacements_pattern = re.compile(b'|'.join(map(re.escape, byte_replacements)))
+
+
+def patch_gui(file_path='sentinel_gui_fixed.py'):
+    """Patch the GUI file in place with the replacements above"""
+    # One scan over a read-only map of the file matches every pattern at
+    # once; the text is never decoded and only the spans between matches
+    # are copied out
+    chunks = []
+    replaced = set()
+    with open(file_path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        last = 0
+        for match in replacements_pattern.finditer(mm):
+            chunks.append(mm[last:match.start()])
+            chunks.append(byte_replacements[match.group(0)])
+            replaced.add(match.group(0))
+            last = match.end()
+        chunks.append(mm[last:])
+
+    for old in byte_replacements:
+        if old in replaced:
+            print(f"Replaced: {old[:50].decode('utf-8')}...")
 
-# Write back
-with open('sentinel_gui_fixed.py', 'w') as f:
-    f.write(content)
+    # Write back once the map is closed
+    if replaced:
+        with open(file_path, 'wb') as f:
+            f.writelines(chunks)
 
-print("Patch applied! Try running the GUI again.")
-'''
+    print("Patch applied! Try running the GUI again.")
 
-with open('patch_gui.py', 'w') as f:
-    f.write(patch_code)
 
-print("Created patch_gui.py. Run it with: python patch_gui.py")
\ No newline at end of file
+if __name__ == "__main__":
+    patch_gui()
\ No newline at end of file
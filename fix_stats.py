@@ -1,63 +1,90 @@
 ﻿import sys
 import os
+import ast
+import mmap
+import tempfile
 
 # Fix the sentinel_gui.py file
 file_path = "sentinel_gui.py"
 
-with open(file_path, 'r', encoding='utf-8') as f:
-    content = f.read()
+STATS_BLOCK = (
+    b"\n\n        # Initialize stats\n"
+    b"        self.stats = {\n"
+    b"            'passwords_analyzed': 0,\n"
+    b"            'networks_scanned': 0,\n"
+    b"            'breaches_found': 0,\n"
+    b"            'reports_generated': 0\n"
+    b"        }\n"
+    b"        "
+)
 
-# Find the __init__ method and add stats initialization
-import re
 
-# Look for the __init__ method and add stats after colors
-init_pattern = r'def __init__\(self\):(.*?)self\.root = tk\.Tk\(\)'
-match = re.search(init_pattern, content, re.DOTALL)
+def is_self_attr(node, name):
+    """Check whether an assignment target is self.<name>"""
+    return (isinstance(node, ast.Attribute) and node.attr == name
+            and isinstance(node.value, ast.Name) and node.value.id == 'self')
+
+
+def find_init(tree):
+    """Return the __init__ method that creates the Tk root window"""
+    for node in ast.walk(tree):
+        if isinstance(node, ast.FunctionDef) and node.name == '__init__':
+            for stmt in ast.walk(node):
+                if isinstance(stmt, ast.Assign) and any(is_self_attr(t, 'root') for t in stmt.targets):
+                    return node
+    return None
+
+
+def find_assign(func, name):
+    """Return the first self.<name> = ... statement in a method"""
+    for stmt in ast.walk(func):
+        if isinstance(stmt, ast.Assign) and any(is_self_attr(t, name) for t in stmt.targets):
+            return stmt
+    return None
+
+
+def line_offset(buf, lineno):
+    """Return the byte offset where a 1-based line starts in buf"""
+    pos = 0
+    for _ in range(lineno - 1):
+        pos = buf.find(b'\n', pos) + 1
+    return pos
+
+
+# Parse straight from a read-only map of the file: the compiler handles the
+# BOM and the node offsets (lineno / col_offset) are byte offsets into it,
+# so only the two slices around the insertion point are ever copied.
+new_content = None
+with open(file_path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+    # Literal probe first: without a self.colors assignment there is no
+    # anchor for the stats block, so the parse can be skipped entirely
+    has_colors = mm.find(b'self.colors') != -1
+    init = find_init(ast.parse(mm)) if has_colors else None
 
-if match:
-    init_content = match.group(1)
-    
     # Check if stats is initialized
-    if 'self.stats =' not in init_content:
+    if init and find_assign(init, 'stats') is None:
         # Add stats initialization after colors
-        colors_section = "self.colors = {"
-        if colors_section in content:
-            # Find where to insert stats after colors
-            colors_end = content.find(colors_section) + len(colors_section)
-            # Find the end of the colors dictionary
-            brace_count = 0
-            in_string = False
-            escape_next = False
-            for i in range(colors_end, len(content)):
-                char = content[i]
-                
-                if escape_next:
-                    escape_next = False
-                    continue
-                    
-                if char == '\\':
-                    escape_next = True
-                    continue
-                    
-                if char == '"' or char == "'":
-                    in_string = not in_string
-                    continue
-                    
-                if not in_string:
-                    if char == '{':
-                        brace_count += 1
-                    elif char == '}':
-                        brace_count -= 1
-                        if brace_count == 0:
-                            # Found the end of colors dict
-                            insert_pos = i + 1
-                            # Add stats after colors
-                            new_content = content[:insert_pos] + '\n\n        # Initialize stats\n        self.stats = {\n            \'passwords_analyzed\': 0,\n            \'networks_scanned\': 0,\n            \'breaches_found\': 0,\n            \'reports_generated\': 0\n        }\n        ' + content[insert_pos:]
-                            
-                            with open(file_path, 'w', encoding='utf-8') as f:
-                                f.write(new_content)
-                            
-                            print(" Fixed sentinel_gui.py - Added stats initialization")
-                            break
-else:
-    print("Could not find __init__ method to fix")
+        colors = find_assign(init, 'colors')
+        if colors is not None:
+            insert_pos = line_offset(mm, colors.end_lineno) + colors.end_col_offset
+            new_content = mm[:insert_pos] + STATS_BLOCK + mm[insert_pos:]
+
+# The map is closed before the file it backs is replaced. Write to a temp
+# file next to it and rename over the original, so a crash mid-write can
+# never leave a truncated GUI source behind.
+if new_content is not None:
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(file_path) or '.', suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(new_content)
+        os.chmod(tmp_path, os.stat(file_path).st_mode)
+        os.replace(tmp_path, file_path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+    
+    print(" Fixed sentinel_gui.py - Added stats initialization")
+elif not has_colors:
+    print("Could not find self.colors dictionary to fix")
+elif not init:
+    print("Could not find __init__ method to fix")
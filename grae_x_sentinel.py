@@ -5,34 +5,21 @@ Launch GUI or CLI based on arguments
 """
 
 import sys
-import os
-import argparse
-from pathlib import Path
+from types import SimpleNamespace
+
+from _banner import BANNER_BYTES
 
 def display_banner():
     """Display beautiful ASCII banner"""
-    banner = """
-    ╔══════════════════════════════════════════════════════════════╗
-    ║                                                              ║
-    ║    ██████╗ ██████╗  █████╗ ███████╗   ███████╗███████╗      ║
-    ║   ██╔════╝ ██╔══██╗██╔══██╗██╔════╝   ██╔════╝╚══███╔╝      ║
-    ║   ██║  ███╗██████╔╝███████║█████╗     █████╗    ███╔╝       ║
-    ║   ██║   ██║██╔══██╗██╔══██║██╔══╝     ██╔══╝   ███╔╝        ║
-    ║   ╚██████╔╝██║  ██║██║  ██║██║        ███████╗███████╗      ║
-    ║    ╚═════╝ ╚═╝  ╚═╝╚═╝  ╚═╝╚═╝        ╚══════╝╚══════╝      ║
-    ║                                                              ║
-    ║             S E N T I N E L   P R O   v4.0                   ║
-    ║      Complete Cybersecurity Suite - GUI & CLI                ║
-    ║                                                              ║
-    ╚══════════════════════════════════════════════════════════════╝
-    """
-    print("\033[96m" + banner + "\033[0m")
-    print("\033[92m" + "="*70 + "\033[0m")
-    print("\033[93m Advanced Password & WiFi Security Tool with Beautiful GUI \033[0m")
-    print("\033[92m" + "="*70 + "\033[0m\n")
+    sys.stdout.buffer.write(BANNER_BYTES)
+    sys.stdout.flush()
+
+MODES = ('gui', 'cli', 'check', 'scan', 'generate', 'report')
+
+def build_parser():
+    """Build the full argparse parser (used for --help and bad arguments)"""
+    import argparse
 
-def main():
-    """Main launcher function"""
     parser = argparse.ArgumentParser(
         description="Grae-X Sentinel Pro - Complete Cybersecurity Suite",
         epilog="Examples:\n  grae_x_sentinel.py gui    (Launch GUI)\n  grae_x_sentinel.py cli    (Launch CLI)\n  grae_x_sentinel.py check \"mypassword\""
@@ -42,7 +29,7 @@ def main():
         'mode',
         nargs='?',
         default='gui',
-        choices=['gui', 'cli', 'check', 'scan', 'generate', 'report'],
+        choices=list(MODES),
         help='Mode: gui (graphical), cli (command line), check (password), scan (wifi), generate (password), report (security)'
     )
     
@@ -58,10 +45,36 @@ def main():
         help='Enable verbose output'
     )
     
-    args = parser.parse_args()
+    return parser
+
+def parse_arguments():
+    """Parse command line: [mode] [args...] [-v/--verbose]"""
+    verbose = False
+    positional = []
+    for arg in sys.argv[1:]:
+        if arg in ('-v', '--verbose'):
+            verbose = True
+        elif arg.startswith('-'):
+            # --help or an unknown option: let argparse print usage / exit
+            return build_parser().parse_args()
+        else:
+            positional.append(arg)
     
-    # Display banner
-    display_banner()
+    mode = positional[0] if positional else 'gui'
+    if mode not in MODES:
+        # Invalid choice: argparse reports it with the usual error message
+        return build_parser().parse_args()
+    
+    return SimpleNamespace(mode=mode, args=positional[1:], verbose=verbose)
+
+def main():
+    """Main launcher function"""
+    args = parse_arguments()
+
+    # Display banner only for interactive modes on a terminal; the other
+    # modes are scriptable one-shots whose output is often piped
+    if args.mode in ('gui', 'cli') and sys.stdout.isatty():
+        display_banner()
     
     # Launch appropriate mode
     if args.mode == 'gui':
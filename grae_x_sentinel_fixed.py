@@ -5,61 +5,97 @@ Launch GUI or CLI based on arguments
 """
 
 import sys
-import os
-import argparse
-from pathlib import Path
+import cmd
+
+from _banner import BANNER_BYTES
 
 def display_banner():
     """Display ASCII banner"""
-    banner = """
-    
-                                                                  
-                     
-                 
-                         
-                          
-                         
-                           
-                                                                  
-                 S E N T I N E L   P R O   v4.0                   
-          Complete Cybersecurity Suite - GUI & CLI                
-                                                                  
-    
-    """
-    print("\033[96m" + banner + "\033[0m")
-    print("\033[92m" + "="*70 + "\033[0m")
-    print("\033[93m Advanced Password & WiFi Security Tool with Beautiful GUI \033[0m")
-    print("\033[92m" + "="*70 + "\033[0m\n")
+    sys.stdout.buffer.write(BANNER_BYTES)
+    sys.stdout.flush()
+
+class SentinelShell(cmd.Cmd):
+    """Simple CLI interface - one do_* method per command"""
+    prompt = "\n> "
+
+    def precmd(self, line):
+        # Commands are case-insensitive (cmd signals end of input as 'EOF')
+        return line if line == 'EOF' else line.strip().lower()
+
+    def onecmd(self, line):
+        try:
+            return super().onecmd(line)
+        except Exception as e:
+            print(f"Error: {e}")
+
+    def emptyline(self):
+        # Don't repeat the previous command on a bare Enter
+        pass
+
+    def default(self, line):
+        print(f"Unknown command: {line}")
+
+    def do_scan(self, arg):
+        """Scan WiFi networks"""
+        print("Scanning WiFi networks...")
+        # Add WiFi scanning logic here
+        print("WiFi scan completed (CLI mode)")
+
+    def do_check(self, arg):
+        """Check password strength"""
+        password = input("Enter password to check: ")
+        print(f"Checking password: {password}")
+        # Add password checking logic here
+        print("Password check completed (CLI mode)")
+
+    def do_generate(self, arg):
+        """Generate password"""
+        print("Generating password...")
+        # Add password generation logic here
+        print("Password: RandomPass123! (CLI mode)")
+
+    def do_exit(self, arg):
+        """Exit program"""
+        print("Exiting Grae-X Sentinel Pro...")
+        return True
+
+    def do_EOF(self, arg):
+        print("\nExiting...")
+        return True
 
 def main():
     """Main launcher function"""
-    parser = argparse.ArgumentParser(
-        description="Grae-X Sentinel Pro - Complete Cybersecurity Suite",
-        epilog="Examples:\n  grae_x_sentinel.py gui    (Launch GUI)\n  grae_x_sentinel.py cli    (Launch CLI)"
-    )
-
-    parser.add_argument(
-        'mode',
-        nargs='?',
-        default='gui',
-        choices=['gui', 'cli'],
-        help='Mode: gui (graphical), cli (command line)'
-    )
-
-    args = parser.parse_args()
+    # No arguments means the default GUI mode, so skip the parser entirely
+    if len(sys.argv) > 1:
+        import argparse
+
+        parser = argparse.ArgumentParser(
+            description="Grae-X Sentinel Pro - Complete Cybersecurity Suite",
+            epilog="Examples:\n  grae_x_sentinel.py gui    (Launch GUI)\n  grae_x_sentinel.py cli    (Launch CLI)"
+        )
+
+        parser.add_argument(
+            'mode',
+            nargs='?',
+            default='gui',
+            choices=['gui', 'cli'],
+            help='Mode: gui (graphical), cli (command line)'
+        )
+
+        mode = parser.parse_args().mode
+    else:
+        mode = 'gui'
     
     display_banner()
     
-    if args.mode == 'gui':
+    if mode == 'gui':
         print("Launching Grae-X Sentinel Pro GUI...")
         print("-" * 70)
         
         # Try to import and run the fixed GUI
         try:
-            # Add current directory to path
-            sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
-            
-            # Import the fixed GUI module
+            # Import the fixed GUI module (the script directory is already
+            # sys.path[0], as the _banner import above relies on)
             from sentinel_gui_fixed import SentinelGUI
             
             # Run the application
@@ -74,7 +110,7 @@ def main():
             import traceback
             traceback.print_exc()
     
-    elif args.mode == 'cli':
+    elif mode == 'cli':
         print("CLI mode selected")
         print("Note: CLI interface is under development.")
         print("For now, use the GUI with: python grae_x_sentinel.py gui")
@@ -86,38 +122,10 @@ def main():
         print("  generate - Generate password")
         print("  exit    - Exit program")
         
-        while True:
-            try:
-                command = input("\n> ").strip().lower()
-                
-                if command == 'scan':
-                    print("Scanning WiFi networks...")
-                    # Add WiFi scanning logic here
-                    print("WiFi scan completed (CLI mode)")
-                
-                elif command == 'check':
-                    password = input("Enter password to check: ")
-                    print(f"Checking password: {password}")
-                    # Add password checking logic here
-                    print("Password check completed (CLI mode)")
-                
-                elif command == 'generate':
-                    print("Generating password...")
-                    # Add password generation logic here
-                    print("Password: RandomPass123! (CLI mode)")
-                
-                elif command == 'exit':
-                    print("Exiting Grae-X Sentinel Pro...")
-                    break
-                
-                else:
-                    print(f"Unknown command: {command}")
-            
-            except KeyboardInterrupt:
-                print("\nExiting...")
-                break
-            except Exception as e:
-                print(f"Error: {e}")
+        try:
+            SentinelShell().cmdloop()
+        except KeyboardInterrupt:
+            print("\nExiting...")
 
 if __name__ == "__main__":
     main()
@@ -8,10 +8,14 @@ import sys
 import os
 import argparse
 import json
+import re
 from pathlib import Path
+from itertools import islice
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, wait
 from datetime import datetime
 from typing import Dict, List
 import getpass
+import functools
 
 # Import modules
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
@@ -21,6 +25,109 @@ from modules.breach_checker import BreachChecker
 from modules.password_generator import PasswordGenerator
 from modules.report_generator import ReportGenerator
 
+# Colors for CLI, as module constants so hot print paths skip the dict lookup
+RESET = '\033[0m'
+BOLD = '\033[1m'
+RED = '\033[91m'
+GREEN = '\033[92m'
+YELLOW = '\033[93m'
+BLUE = '\033[94m'
+MAGENTA = '\033[95m'
+CYAN = '\033[96m'
+WHITE = '\033[97m'
+
+COLORS = {
+    'reset': RESET,
+    'bold': BOLD,
+    'red': RED,
+    'green': GREEN,
+    'yellow': YELLOW,
+    'blue': BLUE,
+    'magenta': MAGENTA,
+    'cyan': CYAN,
+    'white': WHITE,
+}
+
+# Network security classification: one regex pass per security string.
+# When several types appear (mixed modes) the first in _SEC_PRIORITY wins,
+# so e.g. "WPA/WPA2" counts as WPA2.
+_SEC_RE = re.compile(r"WEP|OPEN|NONE|WPA3|WPA2|WPA", re.IGNORECASE)
+_SEC_PRIORITY = ('WEP', 'OPEN', 'NONE', 'WPA2', 'WPA3', 'WPA')
+_RISK = {
+    'WEP': ('CRITICAL', RED),
+    'OPEN': ('HIGH', RED),
+    'NONE': ('HIGH', RED),
+    'WPA': ('MEDIUM', YELLOW),
+    'WPA2': ('LOW', GREEN),
+    'WPA3': ('LOW', GREEN),
+}
+
+def classify_security(security):
+    """Return the security type found in a string (WEP, OPEN, ...) or None"""
+    found = {match.upper() for match in _SEC_RE.findall(security)}
+    return next((kind for kind in _SEC_PRIORITY if kind in found), None)
+
+def classify_risk(security):
+    """Return (risk label, color) for a network security string"""
+    return _RISK.get(classify_security(security), ('LOW', GREEN))
+
+QUICK_CHECK_PASSWORDS = ('password', '123456', 'admin', 'welcome', 'qwerty')
+
+@functools.lru_cache(maxsize=None)
+def quick_check_scores():
+    """Analyzer scores of the quick-check passwords (fixed input, so computed once)"""
+    analyzer = PasswordAnalyzer()
+    return {pwd: analyzer.analyze(pwd)['score'] for pwd in QUICK_CHECK_PASSWORDS}
+
+# Static part of quick_check (checks 2 and 3)
+QUICK_CHECK_TIPS = (
+    f"\n{YELLOW}2. WiFi Security Basics:{RESET}\n"
+    f"   {GREEN}✅ Use WPA2/WPA3 encryption{RESET}\n"
+    f"   {GREEN}✅ 12+ character passwords{RESET}\n"
+    f"   {GREEN}✅ Change default router settings{RESET}\n"
+    f"\n{YELLOW}3. Security Recommendations:{RESET}\n"
+    f"   {CYAN}• Enable two-factor authentication{RESET}\n"
+    f"   {CYAN}• Use password manager{RESET}\n"
+    f"   {CYAN}• Regular software updates{RESET}\n"
+    f"   {CYAN}• Backup important data{RESET}\n"
+)
+
+CLEAR_SCREEN = '\033[2J\033[H'
+
+def supports_ansi():
+    """Check whether stdout is a terminal that handles ANSI escapes"""
+    if not sys.stdout.isatty():
+        return False
+    if os.name != 'nt':
+        return os.environ.get('TERM', '') != 'dumb'
+    
+    # Windows: the console must have (or accept) VT processing
+    try:
+        import ctypes
+        from ctypes import wintypes
+        ENABLE_VIRTUAL_TERMINAL_PROCESSING = 0x0004
+        kernel32 = ctypes.windll.kernel32
+        handle = kernel32.GetStdHandle(-11)  # STD_OUTPUT_HANDLE
+        mode = wintypes.DWORD()
+        if not kernel32.GetConsoleMode(handle, ctypes.byref(mode)):
+            return False
+        if mode.value & ENABLE_VIRTUAL_TERMINAL_PROCESSING:
+            return True
+        return bool(kernel32.SetConsoleMode(handle, mode.value | ENABLE_VIRTUAL_TERMINAL_PROCESSING))
+    except Exception:
+        return False
+
+# Per-process analyzer used by batch_password_check's worker pool
+_worker_analyzer = None
+
+def _analyze_worker(password):
+    """Analyze one password in a pool worker, returning (score, strength)"""
+    global _worker_analyzer
+    if _worker_analyzer is None:
+        _worker_analyzer = PasswordAnalyzer()
+    result = _worker_analyzer.analyze(password)
+    return result['score'], result['strength']
+
 class SentinelCLI:
     """Command Line Interface for Grae-X Sentinel Pro"""
     
@@ -31,23 +138,20 @@ class SentinelCLI:
         self.password_generator = PasswordGenerator()
         self.report_generator = ReportGenerator()
         
-        # Colors for CLI
-        self.colors = {
-            'reset': '\033[0m',
-            'bold': '\033[1m',
-            'red': '\033[91m',
-            'green': '\033[92m',
-            'yellow': '\033[93m',
-            'blue': '\033[94m',
-            'magenta': '\033[95m',
-            'cyan': '\033[96m',
-            'white': '\033[97m',
-        }
+        # Colors for CLI (looked up by name, e.g. print_result's color)
+        self.colors = COLORS
+        
+        # Checked once: clear_screen runs on every menu cycle
+        self.ansi_terminal = supports_ansi()
+        
+        # Banner and menu are redrawn on every menu cycle; build them once
+        self._banner = self._build_banner()
+        self._menu = self._build_menu()
     
-    def print_banner(self):
-        """Print CLI banner"""
+    def _build_banner(self):
+        """Build CLI banner text (with trailing newline)"""
         banner = f"""
-{self.colors['cyan']}
+{CYAN}
 ╔══════════════════════════════════════════════════════════════╗
 ║                                                              ║
 ║     ██████╗ ██████╗  █████╗ ███████╗   ███████╗███████╗     ║
@@ -61,59 +165,87 @@ class SentinelCLI:
 ║           Command Line Interface - Cybersecurity Suite       ║
 ║                                                              ║
 ╚══════════════════════════════════════════════════════════════╝
-{self.colors['reset']}
+{RESET}
 """
-        print(banner)
+        return banner + "\n"
     
-    def print_menu(self):
-        """Print main menu"""
+    def print_banner(self):
+        """Print CLI banner"""
+        sys.stdout.write(self._banner)
+    
+    def _build_menu(self):
+        """Build main menu text"""
         menu = f"""
-{self.colors['bold']}{self.colors['blue']}MAIN MENU{self.colors['reset']}
+{BOLD}{BLUE}MAIN MENU{RESET}
 
-{self.colors['green']}1.{self.colors['reset']} Password Analysis
-{self.colors['green']}2.{self.colors['reset']} WiFi Security Scan
-{self.colors['green']}3.{self.colors['reset']} Password Generator
-{self.colors['green']}4.{self.colors['reset']} Security Reports
-{self.colors['green']}5.{self.colors['reset']} Batch Operations
-{self.colors['green']}6.{self.colors['reset']} Quick Check
-{self.colors['green']}0.{self.colors['reset']} Exit
+{GREEN}1.{RESET} Password Analysis
+{GREEN}2.{RESET} WiFi Security Scan
+{GREEN}3.{RESET} Password Generator
+{GREEN}4.{RESET} Security Reports
+{GREEN}5.{RESET} Batch Operations
+{GREEN}6.{RESET} Quick Check
+{GREEN}0.{RESET} Exit
 
-{self.colors['yellow']}Enter choice:{self.colors['reset']} """
+{YELLOW}Enter choice:{RESET} """
         return menu
     
+    def print_menu(self):
+        """Return main menu text"""
+        return self._menu
+    
     def clear_screen(self):
         """Clear terminal screen"""
-        os.system('cls' if os.name == 'nt' else 'clear')
+        if self.ansi_terminal:
+            sys.stdout.write(CLEAR_SCREEN)
+            sys.stdout.flush()
+        else:
+            os.system('cls' if os.name == 'nt' else 'clear')
     
     def print_header(self, title):
         """Print section header"""
         width = 60
-        print(f"\n{self.colors['bold']}{self.colors['blue']}{'=' * width}")
+        print(f"\n{BOLD}{BLUE}{'=' * width}")
         print(f"{title.center(width)}")
-        print(f"{'=' * width}{self.colors['reset']}\n")
+        print(f"{'=' * width}{RESET}\n")
     
     def print_result(self, label, value, color='white'):
         """Print a result line"""
-        print(f"{self.colors['cyan']}{label:<20}{self.colors['reset']}: {self.colors[color]}{value}{self.colors['reset']}")
+        print(f"{CYAN}{label:<20}{RESET}: {self.colors[color]}{value}{RESET}")
     
     def print_success(self, message):
         """Print success message"""
-        print(f"{self.colors['green']}✅ {message}{self.colors['reset']}")
+        print(f"{GREEN}✅ {message}{RESET}")
     
     def print_warning(self, message):
         """Print warning message"""
-        print(f"{self.colors['yellow']}⚠️  {message}{self.colors['reset']}")
+        print(f"{YELLOW}⚠️  {message}{RESET}")
     
     def print_error(self, message):
         """Print error message"""
-        print(f"{self.colors['red']}❌ {message}{self.colors['reset']}")
+        print(f"{RED}❌ {message}{RESET}")
+    
+    def run_with_spinner(self, func):
+        """Run a blocking call on a worker thread, spinning on stderr until it finishes"""
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            future = executor.submit(func)
+            if sys.stderr.isatty():
+                frames = '|/-\\'
+                i = 0
+                while not future.done():
+                    sys.stderr.write(f"\r{frames[i % 4]} ")
+                    sys.stderr.flush()
+                    i += 1
+                    wait((future,), timeout=0.1)
+                sys.stderr.write("\r  \r")
+                sys.stderr.flush()
+            return future.result()
     
     def password_analysis(self):
         """Password analysis mode"""
         self.print_header("PASSWORD STRENGTH ANALYSIS")
         
         while True:
-            print(f"\n{self.colors['yellow']}Enter password (or 'back' to return):{self.colors['reset']}")
+            print(f"\n{YELLOW}Enter password (or 'back' to return):{RESET}")
             password = getpass.getpass("Password: ")
             
             if password.lower() == 'back':
@@ -124,7 +256,7 @@ class SentinelCLI:
                 continue
             
             # Analyze password
-            print(f"\n{self.colors['cyan']}Analyzing password...{self.colors['reset']}")
+            print(f"\n{CYAN}Analyzing password...{RESET}")
             result = self.password_analyzer.analyze(password)
             
             # Display results
@@ -147,7 +279,7 @@ class SentinelCLI:
                 strength_color = 'red'
                 strength_icon = '❌'
             
-            print(f"{strength_icon} {self.colors[strength_color]}{strength} ({score}/100){self.colors['reset']}\n")
+            print(f"{strength_icon} {self.colors[strength_color]}{strength} ({score}/100){RESET}\n")
             
             # Metrics
             self.print_result("Length", f"{result['length']} characters")
@@ -155,35 +287,35 @@ class SentinelCLI:
             self.print_result("Crack Time", result['crack_time'])
             
             # Requirements
-            print(f"\n{self.colors['cyan']}Requirements:{self.colors['reset']}")
+            print(f"\n{CYAN}Requirements:{RESET}")
             reqs = result['requirements']
             for req, met in reqs.items():
                 icon = '✅' if met else '❌'
                 color = 'green' if met else 'red'
                 req_name = req.replace('_', ' ').title()
-                print(f"  {icon} {self.colors[color]}{req_name}{self.colors['reset']}")
+                print(f"  {icon} {self.colors[color]}{req_name}{RESET}")
             
             # Breach check option
-            print(f"\n{self.colors['yellow']}Check for breaches? (y/n):{self.colors['reset']}", end=' ')
+            print(f"\n{YELLOW}Check for breaches? (y/n):{RESET}", end=' ')
             if input().lower() == 'y':
                 breach_result = self.breach_checker.check(password)
                 if breach_result['breached']:
                     self.print_error(f"PASSWORD BREACHED! Found in {breach_result['count']:,} data breaches!")
-                    print(f"{self.colors['red']}CHANGE THIS PASSWORD IMMEDIATELY!{self.colors['reset']}")
+                    print(f"{RED}CHANGE THIS PASSWORD IMMEDIATELY!{RESET}")
                 else:
                     self.print_success("No breaches found")
             
-            print(f"\n{self.colors['cyan']}{'─' * 60}{self.colors['reset']}")
+            print(f"\n{CYAN}{'─' * 60}{RESET}")
     
     def wifi_scan(self):
         """WiFi security scan"""
         self.print_header("WiFi SECURITY SCAN")
         
-        print(f"{self.colors['yellow']}Note: Run as Administrator/root for best results{self.colors['reset']}")
-        print(f"{self.colors['cyan']}Scanning for WiFi networks...{self.colors['reset']}\n")
+        print(f"{YELLOW}Note: Run as Administrator/root for best results{RESET}")
+        print(f"{CYAN}Scanning for WiFi networks...{RESET}\n")
         
         try:
-            networks = self.wifi_scanner.scan()
+            networks = self.run_with_spinner(self.wifi_scanner.scan)
             
             if not networks:
                 self.print_error("No networks found or insufficient permissions")
@@ -191,9 +323,11 @@ class SentinelCLI:
             
             self.print_success(f"Found {len(networks)} network(s)\n")
             
-            # Display networks
-            print(f"{self.colors['cyan']}{'#':<3} {'SSID':<25} {'Security':<15} {'Signal':<10} {'Risk':<10}{self.colors['reset']}")
-            print(f"{self.colors['cyan']}{'─' * 60}{self.colors['reset']}")
+            # Display networks (the table is built up and written in one go)
+            rows = [
+                f"{CYAN}{'#':<3} {'SSID':<25} {'Security':<15} {'Signal':<10} {'Risk':<10}{RESET}",
+                f"{CYAN}{'─' * 60}{RESET}",
+            ]
             
             for i, net in enumerate(networks, 1):
                 ssid = net.get('ssid', 'Hidden')[:24]
@@ -201,23 +335,14 @@ class SentinelCLI:
                 signal = net.get('signal', 'N/A')[:9]
                 
                 # Determine risk
-                if 'WEP' in security:
-                    risk = 'CRITICAL'
-                    risk_color = 'red'
-                elif 'OPEN' in security:
-                    risk = 'HIGH'
-                    risk_color = 'red'
-                elif 'WPA' in security and 'WPA2' not in security:
-                    risk = 'MEDIUM'
-                    risk_color = 'yellow'
-                else:
-                    risk = 'LOW'
-                    risk_color = 'green'
+                risk, risk_color = classify_risk(security)
                 
-                print(f"{i:<3} {ssid:<25} {security:<15} {signal:<10} {self.colors[risk_color]}{risk:<10}{self.colors['reset']}")
+                rows.append(f"{i:<3} {ssid:<25} {security:<15} {signal:<10} {risk_color}{risk:<10}{RESET}")
+            
+            sys.stdout.write("\n".join(rows) + "\n")
             
             # Option to analyze specific network
-            print(f"\n{self.colors['yellow']}Enter number to analyze (or Enter to skip):{self.colors['reset']}", end=' ')
+            print(f"\n{YELLOW}Enter number to analyze (or Enter to skip):{RESET}", end=' ')
             try:
                 choice = input().strip()
                 if choice and choice.isdigit():
@@ -228,7 +353,7 @@ class SentinelCLI:
                 pass
             
             # Generate report
-            print(f"\n{self.colors['yellow']}Generate report? (y/n):{self.colors['reset']}", end=' ')
+            print(f"\n{YELLOW}Generate report? (y/n):{RESET}", end=' ')
             if input().lower() == 'y':
                 self.report_generator.generate_wifi_report(networks)
                 self.print_success("WiFi report generated in reports/ folder")
@@ -243,20 +368,21 @@ class SentinelCLI:
         security = network.get('security', 'Unknown')
         signal = network.get('signal', 'N/A')
         
-        print(f"{self.colors['cyan']}Security:{self.colors['reset']} {security}")
-        print(f"{self.colors['cyan']}Signal:{self.colors['reset']} {signal}")
+        print(f"{CYAN}Security:{RESET} {security}")
+        print(f"{CYAN}Signal:{RESET} {signal}")
         
         # Security assessment
-        if 'WEP' in security:
+        kind = classify_security(security)
+        if kind == 'WEP':
             self.print_error("WEP ENCRYPTION - EASILY CRACKABLE")
-            print(f"{self.colors['red']}Upgrade to WPA2/WPA3 immediately!{self.colors['reset']}")
-        elif 'OPEN' in security or 'NONE' in security:
+            print(f"{RED}Upgrade to WPA2/WPA3 immediately!{RESET}")
+        elif kind in ('OPEN', 'NONE'):
             self.print_error("OPEN NETWORK - NO ENCRYPTION")
-            print(f"{self.colors['red']}Enable WPA2/WPA3 encryption!{self.colors['reset']}")
-        elif 'WPA' in security and 'WPA2' not in security:
+            print(f"{RED}Enable WPA2/WPA3 encryption!{RESET}")
+        elif kind == 'WPA':
             self.print_warning("Original WPA - Vulnerable to attacks")
-            print(f"{self.colors['yellow']}Upgrade to WPA2 or WPA3{self.colors['reset']}")
-        elif 'WPA2' in security or 'WPA3' in security:
+            print(f"{YELLOW}Upgrade to WPA2 or WPA3{RESET}")
+        elif kind in ('WPA2', 'WPA3'):
             self.print_success("Good encryption (WPA2/WPA3)")
         
         print()
@@ -265,21 +391,21 @@ class SentinelCLI:
         """Password generator"""
         self.print_header("PASSWORD GENERATOR")
         
-        print(f"{self.colors['yellow']}Configure password settings:{self.colors['reset']}")
+        print(f"{YELLOW}Configure password settings:{RESET}")
         
         # Get length
-        length = input(f"{self.colors['cyan']}Length (12-32, default 16):{self.colors['reset']} ").strip()
+        length = input(f"{CYAN}Length (12-32, default 16):{RESET} ").strip()
         length = int(length) if length.isdigit() else 16
         length = max(12, min(32, length))
         
         # Get character types
-        print(f"\n{self.colors['cyan']}Include character types:{self.colors['reset']}")
+        print(f"\n{CYAN}Include character types:{RESET}")
         use_lower = input("Lowercase (a-z)? (y/n, default y): ").strip().lower() != 'n'
         use_upper = input("Uppercase (A-Z)? (y/n, default y): ").strip().lower() != 'n'
         use_digits = input("Digits (0-9)? (y/n, default y): ").strip().lower() != 'n'
         use_special = input("Special characters (!@#$)? (y/n, default y): ").strip().lower() != 'n'
         
-        print(f"\n{self.colors['cyan']}Generating password...{self.colors['reset']}")
+        print(f"\n{CYAN}Generating password...{RESET}")
         
         password = self.password_generator.generate(
             length=length,
@@ -289,21 +415,22 @@ class SentinelCLI:
             use_special=use_special
         )
         
-        print(f"\n{self.colors['green']}Generated Password:{self.colors['reset']}")
-        print(f"{self.colors['bold']}{password}{self.colors['reset']}")
-        print(f"{self.colors['cyan']}Length:{self.colors['reset']} {len(password)} characters")
+        print(f"\n{GREEN}Generated Password:{RESET}")
+        print(f"{BOLD}{password}{RESET}")
+        print(f"{CYAN}Length:{RESET} {len(password)} characters")
         
         # Auto-analyze
-        print(f"\n{self.colors['cyan']}Analyzing generated password...{self.colors['reset']}")
+        print(f"\n{CYAN}Analyzing generated password...{RESET}")
         result = self.password_analyzer.analyze(password)
-        print(f"{self.colors['green']}Strength: {result['strength']} ({result['score']}/100){self.colors['reset']}")
+        print(f"{GREEN}Strength: {result['strength']} ({result['score']}/100){RESET}")
         
         # Save option
-        print(f"\n{self.colors['yellow']}Save to file? (y/n):{self.colors['reset']}", end=' ')
+        print(f"\n{YELLOW}Save to file? (y/n):{RESET}", end=' ')
         if input().lower() == 'y':
-            filename = f"generated_password_{datetime.now().strftime('%Y%m%d_%H%M%S')}.txt"
+            now = datetime.now()  # One timestamp for the file name and its contents
+            filename = f"generated_password_{now.strftime('%Y%m%d_%H%M%S')}.txt"
             with open(filename, 'w') as f:
-                f.write(f"Generated: {datetime.now()}\n")
+                f.write(f"Generated: {now}\n")
                 f.write(f"Password: {password}\n")
                 f.write(f"Length: {len(password)}\n")
                 f.write(f"Strength: {result['strength']} ({result['score']}/100)\n")
@@ -313,7 +440,7 @@ class SentinelCLI:
         """Security reports"""
         self.print_header("SECURITY REPORTS")
         
-        print(f"{self.colors['cyan']}Select report type:{self.colors['reset']}\n")
+        print(f"{CYAN}Select report type:{RESET}\n")
         
         reports = [
             ("1", "Password Audit", "Analyze password database"),
@@ -324,10 +451,10 @@ class SentinelCLI:
         ]
         
         for num, title, desc in reports:
-            print(f"{self.colors['green']}{num}.{self.colors['reset']} {title}")
-            print(f"   {self.colors['cyan']}{desc}{self.colors['reset']}")
+            print(f"{GREEN}{num}.{RESET} {title}")
+            print(f"   {CYAN}{desc}{RESET}")
         
-        print(f"\n{self.colors['yellow']}Enter choice:{self.colors['reset']}", end=' ')
+        print(f"\n{YELLOW}Enter choice:{RESET}", end=' ')
         choice = input().strip()
         
         if choice == '1':
@@ -352,7 +479,7 @@ class SentinelCLI:
         """Batch operations"""
         self.print_header("BATCH OPERATIONS")
         
-        print(f"{self.colors['cyan']}Select batch operation:{self.colors['reset']}\n")
+        print(f"{CYAN}Select batch operation:{RESET}\n")
         
         operations = [
             ("1", "Batch Password Check", "Check multiple passwords from file"),
@@ -361,10 +488,10 @@ class SentinelCLI:
         ]
         
         for num, title, desc in operations:
-            print(f"{self.colors['green']}{num}.{self.colors['reset']} {title}")
-            print(f"   {self.colors['cyan']}{desc}{self.colors['reset']}")
+            print(f"{GREEN}{num}.{RESET} {title}")
+            print(f"   {CYAN}{desc}{RESET}")
         
-        print(f"\n{self.colors['yellow']}Enter choice:{self.colors['reset']}", end=' ')
+        print(f"\n{YELLOW}Enter choice:{RESET}", end=' ')
         choice = input().strip()
         
         if choice == '1':
@@ -380,7 +507,7 @@ class SentinelCLI:
         """Batch password check"""
         self.print_header("BATCH PASSWORD CHECK")
         
-        print(f"{self.colors['cyan']}Enter path to password file (one per line):{self.colors['reset']}")
+        print(f"{CYAN}Enter path to password file (one per line):{RESET}")
         filepath = input("File: ").strip()
         
         if not os.path.exists(filepath):
@@ -388,55 +515,68 @@ class SentinelCLI:
             return
         
         try:
+            # Read lazily and stop at the 1000-password limit, so a huge dump
+            # is never loaded into memory as a whole
             with open(filepath, 'r') as f:
-                passwords = [line.strip() for line in f if line.strip()]
+                stripped = (line.strip() for line in f)
+                passwords = list(islice(filter(None, stripped), 1000))
             
-            print(f"\n{self.colors['cyan']}Checking {len(passwords)} passwords...{self.colors['reset']}")
+            print(f"\n{CYAN}Checking {len(passwords)} passwords...{RESET}")
             
-            results = []
+            total_checked = 0
             weak_passwords = []
             
-            for i, password in enumerate(passwords[:1000], 1):  # Limit to 1000
-                result = self.password_analyzer.analyze(password)
-                results.append((password, result))
-                
-                if result['score'] < 40:
-                    weak_passwords.append((password, result['score']))
-                
-                if i % 100 == 0:
-                    print(f"  Checked {i} passwords...")
+            # Analysis is CPU-bound, so fan it out across worker processes;
+            # the workers only send back (score, strength)
+            with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+                analyzed = executor.map(_analyze_worker, passwords, chunksize=64)
+                for password, (score, strength) in zip(passwords, analyzed):
+                    total_checked += 1
+                    
+                    if score < 40:
+                        weak_passwords.append((password, score))
+                    
+                    if total_checked % 100 == 0:
+                        sys.stdout.write(f"  Checked {total_checked} passwords...\n")
             
             # Generate report
-            report_file = f"batch_check_{datetime.now().strftime('%Y%m%d_%H%M%S')}.txt"
+            now = datetime.now()
+            report_file = f"batch_check_{now.strftime('%Y%m%d_%H%M%S')}.txt"
+            parts = [
+                "BATCH PASSWORD CHECK REPORT\n",
+                "="*50 + "\n\n",
+                f"Date: {now}\n",
+                f"Passwords checked: {total_checked}\n",
+                f"Weak passwords found: {len(weak_passwords)}\n\n",
+            ]
+            
+            if weak_passwords:
+                parts.append("WEAK PASSWORDS FOUND:\n")
+                parts.append("-"*30 + "\n")
+                parts.extend(f"{pwd[:10]}... - Score: {score}/100\n"
+                             for pwd, score in weak_passwords[:50])  # Show first 50
+            
+            parts.append(
+                "\nRECOMMENDATIONS:\n"
+                + "-"*30 + "\n"
+                "1. Change all weak passwords immediately\n"
+                "2. Use 12+ character passwords\n"
+                "3. Enable two-factor authentication\n"
+                "4. Use a password manager\n"
+            )
+            
             with open(report_file, 'w') as f:
-                f.write("BATCH PASSWORD CHECK REPORT\n")
-                f.write("="*50 + "\n\n")
-                f.write(f"Date: {datetime.now()}\n")
-                f.write(f"Passwords checked: {len(results)}\n")
-                f.write(f"Weak passwords found: {len(weak_passwords)}\n\n")
-                
-                if weak_passwords:
-                    f.write("WEAK PASSWORDS FOUND:\n")
-                    f.write("-"*30 + "\n")
-                    for pwd, score in weak_passwords[:50]:  # Show first 50
-                        f.write(f"{pwd[:10]}... - Score: {score}/100\n")
-                
-                f.write("\nRECOMMENDATIONS:\n")
-                f.write("-"*30 + "\n")
-                f.write("1. Change all weak passwords immediately\n")
-                f.write("2. Use 12+ character passwords\n")
-                f.write("3. Enable two-factor authentication\n")
-                f.write("4. Use a password manager\n")
+                f.write("".join(parts))
             
             self.print_success(f"Batch check complete!")
-            print(f"{self.colors['cyan']}Results:{self.colors['reset']}")
-            print(f"  Total passwords: {len(results)}")
+            print(f"{CYAN}Results:{RESET}")
+            print(f"  Total passwords: {total_checked}")
             print(f"  Weak passwords: {len(weak_passwords)}")
             print(f"  Report file: {report_file}")
             
             if weak_passwords:
                 self.print_error(f"{len(weak_passwords)} WEAK PASSWORDS FOUND!")
-                print(f"{self.colors['red']}Change these passwords immediately!{self.colors['reset']}")
+                print(f"{RED}Change these passwords immediately!{RESET}")
         
         except Exception as e:
             self.print_error(f"Error: {str(e)}")
@@ -446,26 +586,25 @@ class SentinelCLI:
         self.print_header("BATCH PASSWORD GENERATOR")
         
         try:
-            count = input(f"{self.colors['cyan']}Number of passwords to generate (1-100):{self.colors['reset']} ").strip()
+            count = input(f"{CYAN}Number of passwords to generate (1-100):{RESET} ").strip()
             count = int(count) if count.isdigit() else 10
             count = max(1, min(100, count))
             
-            length = input(f"{self.colors['cyan']}Password length (12-32, default 16):{self.colors['reset']} ").strip()
+            length = input(f"{CYAN}Password length (12-32, default 16):{RESET} ").strip()
             length = int(length) if length.isdigit() else 16
             length = max(12, min(32, length))
             
-            print(f"\n{self.colors['cyan']}Generating {count} passwords...{self.colors['reset']}")
+            print(f"\n{CYAN}Generating {count} passwords...{RESET}")
             
-            passwords = []
-            for i in range(count):
-                password = self.password_generator.generate(length=length)
-                passwords.append(password)
-                print(f"  {i+1:3}. {password}")
+            generate = self.password_generator.generate
+            passwords = [generate(length=length) for _ in range(count)]
+            sys.stdout.write("".join(f"  {i:3}. {pwd}\n" for i, pwd in enumerate(passwords, 1)))
             
             # Save to file
-            filename = f"password_list_{datetime.now().strftime('%Y%m%d_%H%M%S')}.txt"
+            now = datetime.now()
+            filename = f"password_list_{now.strftime('%Y%m%d_%H%M%S')}.txt"
             with open(filename, 'w') as f:
-                f.write(f"Generated: {datetime.now()}\n")
+                f.write(f"Generated: {now}\n")
                 f.write(f"Count: {count}\n")
                 f.write(f"Length: {length}\n\n")
                 for i, pwd in enumerate(passwords, 1):
@@ -480,8 +619,8 @@ class SentinelCLI:
         """Batch WiFi audit"""
         self.print_header("BATCH WiFi AUDIT")
         
-        print(f"{self.colors['yellow']}This will perform comprehensive WiFi security audit{self.colors['reset']}")
-        print(f"{self.colors['cyan']}Scanning networks...{self.colors['reset']}")
+        print(f"{YELLOW}This will perform comprehensive WiFi security audit{RESET}")
+        print(f"{CYAN}Scanning networks...{RESET}")
         
         try:
             networks = self.wifi_scanner.scan()
@@ -490,52 +629,49 @@ class SentinelCLI:
                 self.print_error("No networks found")
                 return
             
-            # Analyze each network
-            insecure_networks = []
-            for net in networks:
-                if 'WEP' in net.get('security', '') or 'OPEN' in net.get('security', ''):
-                    insecure_networks.append(net)
+            # Analyze each network (classified once, reused by the report)
+            risks = [classify_risk(net.get('security', 'Unknown'))[0] for net in networks]
+            insecure_networks = [net for net, risk in zip(networks, risks)
+                                 if risk in ('CRITICAL', 'HIGH')]
             
             # Generate report
-            report_file = f"wifi_audit_{datetime.now().strftime('%Y%m%d_%H%M%S')}.txt"
-            with open(report_file, 'w') as f:
-                f.write("WiFi SECURITY AUDIT REPORT\n")
-                f.write("="*50 + "\n\n")
-                f.write(f"Date: {datetime.now()}\n")
-                f.write(f"Networks found: {len(networks)}\n")
-                f.write(f"Insecure networks: {len(insecure_networks)}\n\n")
+            now = datetime.now()
+            report_file = f"wifi_audit_{now.strftime('%Y%m%d_%H%M%S')}.txt"
+            parts = [
+                "WiFi SECURITY AUDIT REPORT\n",
+                "="*50 + "\n\n",
+                f"Date: {now}\n",
+                f"Networks found: {len(networks)}\n",
+                f"Insecure networks: {len(insecure_networks)}\n\n",
+                "NETWORK DETAILS:\n",
+                "-"*30 + "\n",
+            ]
+            
+            for net, risk in zip(networks, risks):
+                ssid = net.get('ssid', 'Hidden')
+                security = net.get('security', 'Unknown')
+                signal = net.get('signal', 'N/A')
                 
-                f.write("NETWORK DETAILS:\n")
-                f.write("-"*30 + "\n")
-                for net in networks:
-                    ssid = net.get('ssid', 'Hidden')
-                    security = net.get('security', 'Unknown')
-                    signal = net.get('signal', 'N/A')
-                    
-                    if 'WEP' in security:
-                        risk = "CRITICAL"
-                    elif 'OPEN' in security:
-                        risk = "HIGH"
-                    elif 'WPA' in security and 'WPA2' not in security:
-                        risk = "MEDIUM"
-                    else:
-                        risk = "LOW"
-                    
-                    f.write(f"SSID: {ssid}\n")
-                    f.write(f"  Security: {security} ({risk} risk)\n")
-                    f.write(f"  Signal: {signal}\n\n")
-                
-                f.write("RECOMMENDATIONS:\n")
-                f.write("-"*30 + "\n")
-                f.write("1. Use WPA2 or WPA3 encryption\n")
-                f.write("2. Change default router passwords\n")
-                f.write("3. Disable WPS (WiFi Protected Setup)\n")
-                f.write("4. Hide SSID if not needed\n")
-                f.write("5. Enable MAC address filtering\n")
-                f.write("6. Keep router firmware updated\n")
+                parts.append(f"SSID: {ssid}\n"
+                             f"  Security: {security} ({risk} risk)\n"
+                             f"  Signal: {signal}\n\n")
+            
+            parts.append(
+                "RECOMMENDATIONS:\n"
+                + "-"*30 + "\n"
+                "1. Use WPA2 or WPA3 encryption\n"
+                "2. Change default router passwords\n"
+                "3. Disable WPS (WiFi Protected Setup)\n"
+                "4. Hide SSID if not needed\n"
+                "5. Enable MAC address filtering\n"
+                "6. Keep router firmware updated\n"
+            )
+            
+            with open(report_file, 'w') as f:
+                f.write("".join(parts))
             
             self.print_success(f"WiFi audit complete!")
-            print(f"{self.colors['cyan']}Results:{self.colors['reset']}")
+            print(f"{CYAN}Results:{RESET}")
             print(f"  Networks scanned: {len(networks)}")
             print(f"  Insecure networks: {len(insecure_networks)}")
             print(f"  Report file: {report_file}")
@@ -550,17 +686,11 @@ class SentinelCLI:
         """Quick security check"""
         self.print_header("QUICK SECURITY CHECK")
         
-        print(f"{self.colors['cyan']}Performing quick security assessment...{self.colors['reset']}\n")
+        print(f"{CYAN}Performing quick security assessment...{RESET}\n")
         
         # Check 1: Common weak passwords
-        print(f"{self.colors['yellow']}1. Testing common weak passwords...{self.colors['reset']}")
-        common_passwords = ['password', '123456', 'admin', 'welcome', 'qwerty']
-        weak_found = 0
-        
-        for pwd in common_passwords:
-            result = self.password_analyzer.analyze(pwd)
-            if result['score'] < 20:
-                weak_found += 1
+        print(f"{YELLOW}1. Testing common weak passwords...{RESET}")
+        weak_found = sum(1 for score in quick_check_scores().values() if score < 20)
         
         if weak_found > 0:
             self.print_error(f"Found {weak_found} extremely weak common passwords")
@@ -568,21 +698,12 @@ class SentinelCLI:
             self.print_success("No extremely weak common passwords")
         
         # Check 2: WiFi security basics
-        print(f"\n{self.colors['yellow']}2. WiFi Security Basics:{self.colors['reset']}")
-        print(f"   {self.colors['green']}✅ Use WPA2/WPA3 encryption{self.colors['reset']}")
-        print(f"   {self.colors['green']}✅ 12+ character passwords{self.colors['reset']}")
-        print(f"   {self.colors['green']}✅ Change default router settings{self.colors['reset']}")
-        
         # Check 3: General recommendations
-        print(f"\n{self.colors['yellow']}3. Security Recommendations:{self.colors['reset']}")
-        print(f"   {self.colors['cyan']}• Enable two-factor authentication{self.colors['reset']}")
-        print(f"   {self.colors['cyan']}• Use password manager{self.colors['reset']}")
-        print(f"   {self.colors['cyan']}• Regular software updates{self.colors['reset']}")
-        print(f"   {self.colors['cyan']}• Backup important data{self.colors['reset']}")
+        sys.stdout.write(QUICK_CHECK_TIPS)
         
         # Generate quick report
         self.report_generator.generate_quick_report()
-        print(f"\n{self.colors['green']}✅ Quick security report generated in reports/ folder{self.colors['reset']}")
+        print(f"\n{GREEN}✅ Quick security report generated in reports/ folder{RESET}")
     
     def run(self):
         """Run CLI interface"""
@@ -591,11 +712,11 @@ class SentinelCLI:
         
         while True:
             try:
-                print(self.print_menu(), end='')
+                sys.stdout.write(self._menu)
                 choice = input().strip()
                 
                 if choice == '0':
-                    print(f"\n{self.colors['green']}Thank you for using Grae-X Sentinel Pro! 👋{self.colors['reset']}")
+                    print(f"\n{GREEN}Thank you for using Grae-X Sentinel Pro! 👋{RESET}")
                     break
                 
                 elif choice == '1':
@@ -621,16 +742,16 @@ class SentinelCLI:
                 
                 # Pause before showing menu again
                 if choice != '0':
-                    print(f"\n{self.colors['cyan']}Press Enter to continue...{self.colors['reset']}", end='')
+                    print(f"\n{CYAN}Press Enter to continue...{RESET}", end='')
                     input()
                     self.clear_screen()
                     self.print_banner()
             
             except KeyboardInterrupt:
-                print(f"\n\n{self.colors['yellow']}Interrupted. Returning to menu...{self.colors['reset']}")
+                print(f"\n\n{YELLOW}Interrupted. Returning to menu...{RESET}")
             except Exception as e:
                 self.print_error(f"Error: {str(e)}")
-                print(f"{self.colors['cyan']}Press Enter to continue...{self.colors['reset']}", end='')
+                print(f"{CYAN}Press Enter to continue...{RESET}", end='')
                 input()
 
 # Command line entry point
@@ -6,14 +6,19 @@ Advanced Cybersecurity Toolkit with Real-Time Visual Effects
 
 import tkinter as tk
 from tkinter import ttk, scrolledtext, messagebox, filedialog
+import tkinter.font as tkfont
 import json
-import threading
+import queue
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+from functools import partialmethod
 import random
 import time
 from datetime import datetime
 from pathlib import Path
 import sys
 import os
+from operator import attrgetter
 
 # Import our modules
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
@@ -41,6 +46,7 @@ except ImportError as e:
     
     class WiFiScanner:
         def scan(self):
+            time.sleep(2)  # Simulate scanning
             return [
                 {'ssid': 'Neo-Corp WiFi', 'security': 'WPA3-Enterprise', 'signal': '92%', 'channel': '6', 'bssid': '00:11:22:33:44:55'},
                 {'ssid': 'The Matrix', 'security': 'Quantum-Encrypted', 'signal': '88%', 'channel': '11', 'bssid': 'AA:BB:CC:DD:EE:FF'},
@@ -178,81 +184,439 @@ except ImportError as e:
             
             return "\n".join(report)
 
+# Named Tk fonts shared by the canvas effects, keyed by (family, size, weight)
+_font_cache = {}
+
+def cached_font(widget, family, size, weight='normal'):
+    """Return a shared tkinter Font, created on first use"""
+    key = (family, size, weight)
+    font = _font_cache.get(key)
+    if font is None:
+        font = _font_cache[key] = tkfont.Font(root=widget, family=family, size=size, weight=weight)
+    return font
+
+def create_text_items(canvas, items, font, tags, anchor='nw'):
+    """Create many canvas text items in one Tcl call; returns their ids
+    
+    items is a sequence of (x, y, text, fill). Each create_text() is its own
+    Python -> Tcl round-trip, so pools of hundreds of items are built as one
+    "list [$canvas create text ...] ..." script instead. Texts are brace
+    quoted, so they must not contain braces or backslashes.
+    """
+    if not items:
+        return []
+    prefix = f"{canvas._w} create text"
+    options = f"-font {{{font}}} -tags {{{tags}}} -anchor {anchor}"
+    script = "list " + " ".join(
+        f"[{prefix} {x} {y} -text {{{text}}} -fill {{{fill}}} {options}]"
+        for x, y, text, fill in items
+    )
+    return [int(item_id) for item_id in canvas.tk.splitlist(canvas.tk.eval(script))]
+
+# (token, label) pairs, first match wins: the weakest protocol named in a
+# security string decides, and plain 'WPA' only matches after WPA2/WPA3
+_THREAT_RULES = (
+    ('WEP', "CRITICAL ⚠️"),
+    ('OPEN', "CRITICAL ⚠️"),
+    ('WPA2', "MEDIUM ⚠️"),
+    ('WPA3', "LOW ✅"),
+    ('WPA', "HIGH ⚠️"),
+)
+
+# Threat level labels by upper-cased security string, filled on first use
+_threat_cache = {}
+
+def threat_level(security, _rules=_THREAT_RULES):
+    """Return the network tree's THREAT label for a security protocol"""
+    sec = security.upper()
+    threat = _threat_cache.get(sec)
+    if threat is None:
+        threat = _threat_cache[sec] = next(
+            (label for token, label in _rules if token in sec), "UNKNOWN ❓")
+    return threat
+
+# Strength metric texts by score, filled on first use
+_metrics_cache = {}
+
+def strength_metrics(score):
+    """Return the (entropy, crack, pattern, breach) metric texts for a score"""
+    metrics = _metrics_cache.get(score)
+    if metrics is None:
+        metrics = _metrics_cache[score] = (
+            f"{score * 2.5:.1f} bits",
+            "YEARS" if score > 60 else "DAYS" if score > 30 else "HOURS" if score > 10 else "MINUTES",
+            "COMPLEX" if score > 70 else "MODERATE" if score > 40 else "SIMPLE",
+            "SAFE" if score > 80 else "RISK" if score > 50 else "VULNERABLE",
+        )
+    return metrics
+
+# Cards on the reports tab, in grid order; handler names a SentinelGUI method
+ReportCard = namedtuple('ReportCard', 'icon title desc handler')
+REPORT_CARDS = (
+    ReportCard("🔐", "PASSWORD AUDIT", "Analyze password security posture", 'generate_password_report'),
+    ReportCard("📡", "NETWORK ANALYSIS", "Wireless security assessment", 'generate_wifi_report'),
+    ReportCard("📈", "SYSTEM DIAGNOSTICS", "Complete system vulnerability scan", 'generate_dashboard_report'),
+    ReportCard("⚠️", "THREAT DETECTION", "Active threat identification", 'generate_threat_report'),
+    ReportCard("🛡️", "FIREWALL ANALYSIS", "Network protection audit", 'generate_firewall_report'),
+    ReportCard("🔍", "FORENSIC REPORT", "Advanced forensic analysis", 'generate_forensic_report'),
+)
+
+# Fixed reports on the reports tab; {time} is filled in when shown
+_THREAT_REPORT = """THREAT DETECTION REPORT
+━━━━━━━━━━━━━━━━━━━━━━━━
+SCAN TIME: {time}
+THREAT LEVEL: LOW
+DETECTED THREATS: 0
+PROTECTION STATUS: FULL
+
+ACTIVE PROTECTIONS:
+✓ Real-time malware scanning
+✓ Network intrusion detection
+✓ Firewall protection
+✓ Behavioral analysis
+✓ Automated threat response
+
+RECOMMENDATIONS:
+• Keep all software updated
+• Use multi-factor authentication
+• Regular security audits
+• Employee security training
+• Backup critical data regularly
+━━━━━━━━━━━━━━━━━━━━━━━━"""
+
+_FIREWALL_REPORT = """FIREWALL ANALYSIS REPORT
+━━━━━━━━━━━━━━━━━━━━━━━━
+REPORT TIME: {time}
+FIREWALL STATUS: ACTIVE
+BLOCKED ATTEMPTS: 1,247
+ACTIVE RULES: 42
+
+TOP BLOCKED THREATS:
+1. Port scanning attempts
+2. Brute force attacks
+3. Malicious payloads
+4. SQL injection attempts
+5. Cross-site scripting
+
+RECOMMENDATIONS:
+✓ Firewall configuration optimal
+✓ Regular rule updates recommended
+✓ Consider advanced threat protection
+✓ Monitor for new attack vectors
+━━━━━━━━━━━━━━━━━━━━━━━━"""
+
+_FORENSIC_REPORT = """DIGITAL FORENSIC REPORT
+━━━━━━━━━━━━━━━━━━━━━━━━
+ANALYSIS TIME: {time}
+SYSTEM: GRAE-X SENTINEL PRO
+ANALYST: AUTOMATED SYSTEM
+
+FINDINGS:
+• System integrity: 100%
+• No unauthorized access detected
+• All security logs intact
+• Encryption protocols active
+• No evidence of tampering
+
+RECOMMENDATIONS:
+• Continue regular monitoring
+• Maintain current security posture
+• Schedule quarterly audits
+• Update incident response plan
+━━━━━━━━━━━━━━━━━━━━━━━━"""
+
+# Fixed reports by key: (title, color key, template)
+STATIC_REPORTS = {
+    'threat': ("THREAT DETECTION REPORT", 'alert_red', _THREAT_REPORT),
+    'firewall': ("FIREWALL ANALYSIS REPORT", 'warning_orange', _FIREWALL_REPORT),
+    'forensic': ("FORENSIC ANALYSIS REPORT", 'matrix_green', _FORENSIC_REPORT),
+}
+
+# Network tree columns and their widths
+NETWORK_COLUMNS = ('SSID', 'SECURITY', 'SIGNAL', 'CHANNEL', 'THREAT')
+NETWORK_COLUMN_WIDTHS = (250, 150, 100, 100, 120)
+
+# Menu bar: (cascade label, items); an item is (label, SentinelGUI attribute
+# path of its command), or None for a separator
+MENUS = (
+    ("[FILE]", (
+        ("NEW ANALYSIS SESSION", 'new_analysis'),
+        ("LOAD SECURITY REPORT", 'open_report'),
+        None,
+        ("EXPORT ALL DATA", 'export_data'),
+        None,
+        ("EXIT SYSTEM", 'root.quit'),
+    )),
+    ("[TOOLS]", (
+        ("BATCH PASSWORD ANALYSIS", 'batch_password_check'),
+        ("ADVANCED NETWORK SCAN", 'advanced_network_scan'),
+        None,
+        ("TOGGLE MATRIX EFFECT", 'toggle_matrix'),
+        ("CHANGE THEME", 'change_theme'),
+    )),
+    ("[HELP]", (
+        ("USER GUIDE", 'show_guide'),
+        ("KEYBOARD SHORTCUTS", 'show_shortcuts'),
+        None,
+        ("ABOUT GRAE-X SENTINEL", 'show_about'),
+    )),
+)
+
+# Help dialog texts (see show_guide / show_shortcuts / show_about)
+GUIDE_TEXT = """GRAE-X SENTINEL PRO v4.2.1 USER GUIDE
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+CORE FEATURES:
+1. Password Strength Analyzer
+   - Real-time password analysis
+   - Entropy calculation
+   - Crack time estimation
+   - Security recommendations
+
+2. Network Security Scanner
+   - Wireless network detection
+   - Security protocol analysis
+   - Threat level assessment
+   - Vulnerability identification
+
+3. Cryptographic Key Generator
+   - Custom length passwords
+   - Character set selection
+   - Typewriter display effect
+   - Secure storage options
+
+4. Security Reports
+   - Comprehensive analytics
+   - Export capabilities
+   - Forensic analysis
+   - System diagnostics
+
+KEYBOARD SHORTCUTS:
+• F1: Password Analyzer
+• F2: Network Scanner
+• F3: Key Generator
+• F4: Security Reports
+• F5: Dashboard
+• Ctrl+N: New Session
+• Ctrl+S: Save Key
+• Ctrl+Q: Exit System
+
+SYSTEM REQUIREMENTS:
+• Windows 10/11, macOS, Linux
+• Python 3.8 or higher
+• 4GB RAM minimum
+• Network adapter (for scanning)
+• 500MB free disk space
+
+FOR SUPPORT:
+Contact: support@graex-security.com
+Website: https://graex-security.com
+Documentation: https://docs.graex-security.com"""
+
+SHORTCUTS_TEXT = """KEYBOARD SHORTCUTS REFERENCE
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+NAVIGATION:
+• F1: Password Analyzer Tab
+• F2: Network Scanner Tab
+• F3: Key Generator Tab
+• F4: Security Reports Tab
+• F5: Dashboard Tab
+
+ACTIONS:
+• Ctrl+N: Start New Analysis Session
+• Ctrl+S: Save Current Key to Vault
+• Ctrl+Q: Exit Application
+• Space: Trigger Selected Button
+• Enter: Execute Current Operation
+
+QUICK ACCESS:
+• Tab: Navigate between fields
+• Shift+Tab: Navigate backwards
+• Esc: Close current dialog
+• Alt+F4: Close application
+
+SPECIAL FUNCTIONS:
+• Alt+M: Toggle Matrix Effect
+• Alt+T: Change Theme
+• Alt+H: Show Help
+• Alt+A: About System"""
+
+ABOUT_TEXT = """GRAE-X SENTINEL PRO v4.2.1
+━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
+
+ADVANCED CYBERSECURITY SUITE
+Futuristic Interface with Real-Time Analysis
+
+TECHNOLOGY STACK:
+• Quantum-Resistant Algorithms
+• Neural Network Threat Detection
+• Real-Time Security Analytics
+• Encrypted Data Storage
+• Advanced Forensic Tools
+
+FEATURES:
+✓ Matrix-Style Visual Interface
+✓ Real-Time Password Analysis
+✓ Wireless Network Security
+✓ Cryptographic Key Generation
+✓ Comprehensive Security Reports
+✓ System Monitoring Dashboard
+
+SECURITY PROTOCOLS:
+• AES-256 Encryption
+• SHA-3 Hashing
+• TLS 1.3 Communication
+• Zero-Knowledge Architecture
+• Multi-Factor Authentication
+
+WARNING:
+This software is for EDUCATIONAL and
+RESEARCH purposes only. Use responsibly
+and in compliance with all applicable laws.
+
+DEVELOPED BY:
+GRAE-X Security Research Division
+
+© 2024 GRAE-X SECURITY
+All Rights Reserved"""
+
 class MatrixEffect:
     """Falling Matrix code rain effect"""
-    def __init__(self, canvas, width, height):
+    def __init__(self, canvas, width, height, scheduler=None):
         self.canvas = canvas
         self.width = width
         self.height = height
+        # Optional shared animation scheduler (SentinelGUI.schedule_animation);
+        # without one the effect runs its own after() loop via draw()
+        self.scheduler = scheduler
         self.chars = "01アイウエオカキクケコサシスセソタチツテトナニヌネノハヒフヘホマミムメモヤユヨラリルレロワヲン"
-        self.drops = []
         self.font_size = 14
         self.speed = 2
         self.active = True
+        # Frame rate of the standalone draw() loop; drops to 15 fps while
+        # frames take longer than 50 ms (see draw)
+        self.target_fps = 30
+        self._slow_frames = 0
+        # Color strings for every brightness: yellow-ish head, green body
+        self.head_colors = [f'#{b:02x}{b:02x}00' for b in range(256)]
+        self.body_colors = [f'#00{b:02x}00' for b in range(256)]
         self.init_drops()
+        
+        if self.scheduler is not None:
+            self.scheduler(30, self.frame)
     
     def init_drops(self):
-        """Initialize matrix drops"""
-        self.drops = []
-        columns = self.width // self.font_size
+        """Initialize matrix drops
         
-        for i in range(columns):
-            x = i * self.font_size
-            y = random.randint(-500, -50)
-            length = random.randint(5, 30)
-            speed = random.uniform(1, 3)
-            brightness = random.randint(100, 255)
-            self.drops.append({
-                'x': x,
-                'y': y,
-                'length': length,
-                'speed': speed,
-                'chars': [random.choice(self.chars) for _ in range(length)],
-                'brightness': brightness
-            })
+        Drop state is kept as parallel per-column lists (xs[i], ys[i], ...)
+        rather than one dict per drop, so a frame touches no dict lookups.
+        """
+        self.canvas.delete("matrix")
+        columns = self.width // self.font_size
+        font = cached_font(self.canvas, 'Consolas', self.font_size, 'bold')
+        
+        self.xs = [i * self.font_size for i in range(columns)]
+        self.ys = [random.randint(-500, -50) for _ in range(columns)]
+        self.lengths = [random.randint(5, 30) for _ in range(columns)]
+        self.speeds = [random.uniform(1, 3) for _ in range(columns)]
+        self.brightness = [random.randint(100, 255) for _ in range(columns)]
+        # Characters for every drop in one sampling call, then split up
+        pool = random.choices(self.chars, k=sum(self.lengths))
+        starts = [0]
+        for length in self.lengths:
+            starts.append(starts[-1] + length)
+        self.drop_chars = [pool[start:end] for start, end in zip(starts, starts[1:])]
+        self.drop_colors = [self.gradient(brightness, length)
+                            for brightness, length in zip(self.brightness, self.lengths)]
+        # One canvas item per character, created once (in a single Tcl
+        # call) and then only moved / reconfigured
+        ids = iter(create_text_items(
+            self.canvas,
+            [(x, y, '', '') for x, y, length in zip(self.xs, self.ys, self.lengths)
+             for _ in range(length)],
+            font, "matrix"
+        ))
+        self.item_ids = [[next(ids) for _ in range(length)] for length in self.lengths]
+        # Set when a drop's chars/colors change, so its items need new text
+        self.dirty = [True] * columns
+    
+    def gradient(self, brightness, length):
+        """Per-character colors of a drop (head is brightest)"""
+        return [self.head_colors[max(30, brightness)]] + [
+            self.body_colors[max(30, brightness * (length - i) // length)]
+            for i in range(1, length)
+        ]
     
     def draw(self):
         """Draw matrix effect"""
         if not self.active:
             return
         
-        self.canvas.delete("matrix")
+        # While hidden (other tab, minimized window) check back less often
+        if not self.canvas.winfo_viewable():
+            self.canvas.after(250, self.draw)
+            return
         
-        for drop in self.drops:
-            y = drop['y']
-            brightness = drop['brightness']
-            
-            # Draw each character in the drop
-            for i, char in enumerate(drop['chars']):
-                char_y = y + i * self.font_size
-                
-                # Calculate brightness gradient (head is brightest)
-                char_brightness = int(brightness * (1 - i / drop['length']))
-                if char_brightness < 30:
-                    char_brightness = 30
-                
-                color = f'#{char_brightness:02x}{char_brightness:02x}00' if i == 0 else f'#00{char_brightness:02x}00'
-                
-                self.canvas.create_text(
-                    drop['x'], char_y,
-                    text=char,
-                    fill=color,
-                    font=('Consolas', self.font_size, 'bold'),
-                    tags="matrix",
-                    anchor='nw'
-                )
-            
-            # Move drop down
-            drop['y'] += drop['speed']
-            
-            # Reset drop if it goes off screen
-            if drop['y'] - drop['length'] * self.font_size > self.height:
-                drop['y'] = random.randint(-500, -50)
-                drop['chars'] = [random.choice(self.chars) for _ in range(drop['length'])]
-                drop['brightness'] = random.randint(100, 255)
+        start = time.perf_counter()
+        self.frame()
+        elapsed_ms = int((time.perf_counter() - start) * 1000)
+        
+        # Two slow frames in a row drop to 15 fps, two fast ones restore 30
+        if elapsed_ms > 50:
+            self._slow_frames = max(1, self._slow_frames + 1)
+        elif elapsed_ms < 20:
+            self._slow_frames = min(-1, self._slow_frames - 1)
+        if self._slow_frames >= 2:
+            self.target_fps = 15
+        elif self._slow_frames <= -2:
+            self.target_fps = 30
+        
+        # Schedule next frame, counting the time this one already took
+        self.canvas.after(max(5, 1000 // self.target_fps - elapsed_ms), self.draw)
+    
+    def frame(self):
+        """Draw one frame of the matrix effect"""
+        # Nothing to draw while inactive or not on screen
+        if not self.active or not self.canvas.winfo_viewable():
+            return
         
-        # Schedule next frame
-        self.canvas.after(30, self.draw)
+        for item_id, x, y, char, color in self.compute_frame():
+            self.canvas.coords(item_id, x, y)
+            if char is not None:
+                self.canvas.itemconfig(item_id, text=char, fill=color)
+    
+    def compute_frame(self):
+        """Advance the drops one step; return (item_id, x, y, char, color) ops
+        
+        char and color are None when the item's text is unchanged.
+        """
+        ops = []
+        font_size = self.font_size
+        for col, (x, y, item_ids) in enumerate(zip(self.xs, self.ys, self.item_ids)):
+            # Text and colors only change when the drop resets
+            if self.dirty[col]:
+                self.dirty[col] = False
+                ops.extend((item_id, x, y + i * font_size, char, color)
+                           for i, (item_id, char, color)
+                           in enumerate(zip(item_ids, self.drop_chars[col], self.drop_colors[col])))
+            else:
+                ops.extend((item_id, x, y + i * font_size, None, None)
+                           for i, item_id in enumerate(item_ids))
+        
+        # Move drops down
+        self.ys = [y + speed for y, speed in zip(self.ys, self.speeds)]
+        
+        # Reset drops that went off screen
+        for col, (y, length) in enumerate(zip(self.ys, self.lengths)):
+            if y - length * font_size > self.height:
+                self.ys[col] = random.randint(-500, -50)
+                self.drop_chars[col] = random.choices(self.chars, k=length)
+                self.brightness[col] = random.randint(100, 255)
+                self.drop_colors[col] = self.gradient(self.brightness[col], length)
+                self.dirty[col] = True
+        
+        return ops
     
     def toggle(self, active=None):
         """Toggle matrix effect on/off"""
@@ -261,12 +625,12 @@ class MatrixEffect:
         else:
             self.active = not self.active
         
-        if self.active:
+        if self.active and self.scheduler is None:
             self.draw()
 
 class DigitalRainWidget:
     """Digital rain widget for cyberpunk effect"""
-    def __init__(self, parent, width, height):
+    def __init__(self, parent, width, height, scheduler=None):
         self.canvas = tk.Canvas(parent, width=width, height=height, 
                                bg='#0A0A0A', highlightthickness=0)
         self.canvas.pack()
@@ -277,45 +641,93 @@ class DigitalRainWidget:
         self.chars = "0101010101101001011101000111001100100000011000010110111001100100"
         self.font_size = 10
         self.columns = width // self.font_size
+        self.xs = [i * self.font_size for i in range(self.columns)]
         self.drops = [0] * self.columns
         self.colors = ['#00FF00', '#00CC00', '#009900', '#006600']
         
+        # Grid of text items (columns x trail), created once just above the
+        # top edge, where a drop at row -1 would be; each frame only moves
+        # them and changes the text that differs
+        self.trail = min(10, len(self.chars))
+        fs = self.font_size
+        font = cached_font(self.canvas, 'Consolas', fs)
+        ids = iter(create_text_items(
+            self.canvas,
+            [(x, -fs - j * fs, '0', self.colors[min(j, len(self.colors)-1)])
+             for x in self.xs for j in range(self.trail)],
+            font, "rain"
+        ))
+        self.items = [[next(ids) for _ in range(self.trail)] for _ in self.xs]
+        self.prev_chars = [['0'] * self.trail for _ in range(self.columns)]
+        # Each column's items also carry a column tag, so a falling drop is
+        # moved with one canvas call (tagged in a single Tcl script)
+        self.col_tags = [f"rain{i}" for i in range(self.columns)]
+        self.canvas.tk.eval("\n".join(
+            f"{self.canvas._w} addtag {tag} withtag {item_id}"
+            for tag, items in zip(self.col_tags, self.items) for item_id in items
+        ))
+        
         self.running = True
-        self.animate()
+        # Paused (but still scheduled) while its tab is not selected
+        self.active = True
+        # Frames come from the shared scheduler if given, else our own loop
+        if scheduler is not None:
+            scheduler(100, self.step)
+        else:
+            self.animate()
     
     def animate(self):
         """Animate digital rain"""
+        if self.step():
+            self.canvas.after(100, self.animate)
+    
+    def step(self):
+        """Draw one frame of digital rain; returns False once stopped"""
         if not self.running:
-            return
-        
-        self.canvas.delete("rain")
-        
-        for i in range(len(self.drops)):
-            # Randomly reset drops
-            if self.drops[i] > 100 or random.random() > 0.975:
-                self.drops[i] = 0
-            
-            # Draw drop
-            y = self.drops[i] * self.font_size
-            for j in range(min(10, len(self.chars))):
-                char = random.choice(['0', '1'])
-                x = i * self.font_size
-                char_y = y - j * self.font_size
-                
-                if char_y >= 0:
-                    color_idx = min(j, len(self.colors)-1)
-                    self.canvas.create_text(
-                        x, char_y,
-                        text=char,
-                        fill=self.colors[color_idx],
-                        font=('Consolas', self.font_size),
-                        tags="rain",
-                        anchor='nw'
-                    )
+            return False
+        if not self.active:
+            return True
+        
+        # The rain sits on the dashboard tab: skip frames while it is not
+        # on screen (another tab selected, window minimized)
+        if not self.canvas.winfo_viewable():
+            return True
+        
+        # Frame state up front: randomly reset drops, and draw every
+        # character of the frame as one random bit string
+        rnd = random.random
+        drops = [0 if drop > 100 or rnd() > 0.975 else drop for drop in self.drops]
+        trail = self.trail
+        total = len(drops) * trail
+        bits = format(random.getrandbits(total), f'0{total}b') if total else ''
+        
+        fs = self.font_size
+        canvas = self.canvas
+        for i, (x, drop, expected) in enumerate(zip(self.xs, drops, self.drops)):
+            # Draw drop: a drop that kept falling moves down one row as a
+            # whole; only a reset one places its items again
+            y = drop * fs
+            items = self.items[i]
+            if drop == expected:
+                canvas.move(self.col_tags[i], 0, fs)
+            else:
+                for j, item_id in enumerate(items):
+                    canvas.coords(item_id, x, y - j * fs)
             
-            self.drops[i] += 1
-        
-        self.canvas.after(100, self.animate)
+            # Only visible characters that changed get new text
+            prev = self.prev_chars[i]
+            for j in range(min(trail, drop + 1)):
+                char = bits[i * trail + j]
+                if char != prev[j]:
+                    canvas.itemconfigure(items[j], text=char)
+                    prev[j] = char
+        
+        self.drops = [drop + 1 for drop in drops]
+        return True
+    
+    def toggle(self, active=None):
+        """Pause / resume the rain without stopping it"""
+        self.active = not self.active if active is None else active
     
     def stop(self):
         """Stop animation"""
@@ -323,11 +735,38 @@ class DigitalRainWidget:
 
 class SentinelGUI:
     """Main GUI Application - Matrix Edition"""
+    # Lines kept in the dashboard's live security feed
+    FEED_MAX_LINES = 200
+    # Generated key typewriter: milliseconds per tick, characters per tick
+    TYPEWRITER_MS = 30
+    TYPEWRITER_STEP = 2
+    # Messages update_security_feed picks from
+    FEED_MESSAGES = (
+        "> SCANNING FOR NETWORK THREATS... CLEAR",
+        "> FIREWALL PROTECTION: ACTIVE",
+        "> ENCRYPTION MODULE: OPERATIONAL",
+        "> INTRUSION DETECTION: ONLINE",
+        "> SYSTEM INTEGRITY CHECK: 100%",
+        "> NETWORK TRAFFIC ANALYSIS: NORMAL",
+        "> MALWARE SCAN: NO THREATS DETECTED",
+        "> BACKUP SYSTEM: VERIFIED AND SECURE",
+        "> USER ACTIVITY MONITORING: ACTIVE",
+        "> SECURITY PATCHES: UP TO DATE",
+    )
+    # Generator options in the order of the charset bitmask bits
+    CHARSET_FLAGS = ('use_lower', 'use_upper', 'use_digits', 'use_special')
+    CHARSET_ALL = (1 << len(CHARSET_FLAGS)) - 1
+    # Initial main window size (width, height)
+    WINDOW_SIZE = (1400, 900)
+    # How often finished background work is collected while any is running
+    POLL_MS = 10
     
     def __init__(self):
         self.root = tk.Tk()
+        # Kept hidden while the widgets are built; center_window shows it
+        self.root.withdraw()
         self.root.title("GRAE-X SENTINEL PRO // v4.2 // SYSTEM ONLINE")
-        self.root.geometry("1400x900")
+        self.root.geometry("%dx%d" % self.WINDOW_SIZE)
         self.root.minsize(1200, 800)
         
         # Initialize stats
@@ -355,6 +794,53 @@ class SentinelGUI:
             'text_dim': '#666666',
         }
         
+        # Strength meter buckets: (lowest score, color, label), best first
+        self._strength_table = (
+            (80, self.colors['matrix_green'], "IMPENETRABLE"),
+            (60, self.colors['cyber_blue'], "STRONG"),
+            (40, self.colors['warning_orange'], "MODERATE"),
+            (20, "#FF6600", "WEAK"),
+            (0, self.colors['alert_red'], "CRITICAL"),
+        )
+        
+        # Widget options repeated across the tab builders, built once; fonts
+        # are shared named fonts, so Tk does not parse a font spec per widget
+        self.styles = {
+            'tab_title': dict(bg=self.colors['panel_bg'],
+                              font=cached_font(self.root, 'Orbitron', 20, 'bold')),
+            'tab_subtitle': dict(bg=self.colors['panel_bg'],
+                                 fg=self.colors['cyber_green'],
+                                 font=cached_font(self.root, 'Consolas', 11)),
+            'field_label': dict(fg=self.colors['cyber_blue'],
+                                font=cached_font(self.root, 'Consolas', 12, 'bold')),
+            'big_button': dict(bg=self.colors['darker_bg'],
+                               font=cached_font(self.root, 'Orbitron', 14, 'bold'),
+                               relief='raised',
+                               borderwidth=3,
+                               padx=40,
+                               pady=15,
+                               cursor='hand2',
+                               activebackground=self.colors['highlight']),
+            # Report cards (see create_report_card)
+            'card': dict(bg=self.colors['darker_bg'], relief='raised', borderwidth=2,
+                         width=280, height=180),
+            'card_icon': dict(bg=self.colors['darker_bg'],
+                              font=cached_font(self.root, 'Segoe UI', 32)),
+            'card_title': dict(bg=self.colors['darker_bg'],
+                               fg=self.colors['text_primary'],
+                               font=cached_font(self.root, 'Orbitron', 12, 'bold')),
+            'card_desc': dict(bg=self.colors['darker_bg'],
+                              fg=self.colors['text_secondary'],
+                              font=cached_font(self.root, 'Consolas', 8),
+                              wraplength=250),
+            'card_button': dict(text="⚡ GENERATE REPORT",
+                                bg=self.colors['dark_bg'],
+                                font=cached_font(self.root, 'Consolas', 9, 'bold'),
+                                padx=10,
+                                pady=5,
+                                cursor='hand2'),
+        }
+        
         # Initialize modules
         self.password_analyzer = PasswordAnalyzer()
         self.wifi_scanner = WiFiScanner()
@@ -368,6 +854,52 @@ class SentinelGUI:
         self.scanning = False
         self.matrix_effect_active = True
         
+        # Shared animation scheduler: [next_due_ms, interval_ms, callback]
+        # entries, all driven by a single root.after() chain (see _tick)
+        self.animations = []
+        self._tick_id = None
+        # Background effects by the notebook tab they sit on; only the
+        # selected tab's effect is active (see _on_tab_change)
+        self._effects = {}
+        # Security feed lines waiting for the dashboard tab (see log_feed)
+        self._feed_pending = []
+        # Generated key; created here since Ctrl+S reads it before the
+        # generator tab may have been built
+        self.generated_key_var = tk.StringVar()
+        # Key typewriter effect: the key being typed, how much of it is
+        # shown and the pending after() id (see _typewriter_tick)
+        self._typewriter_text = ""
+        self._typewriter_pos = 0
+        self._typewriter_id = None
+        # Generator character sets as a bitmask over CHARSET_FLAGS, kept in
+        # step with the checkboxes so generating reads no Tk variables
+        self._charset_mask = self.CHARSET_ALL
+        # Pending after() id of the live strength update (see on_password_change)
+        self._strength_after_id = None
+        # Strength meter bar, label and metric labels, set by
+        # create_password_tab, and the track width kept current by its
+        # <Configure> binding
+        self.strength_bar = None
+        self.strength_label = None
+        self.metric_labels = {}
+        self._strength_track_width = 1
+        # Last values written to the meter and metric labels, so unchanged
+        # ones are not reconfigured (see update_strength_display)
+        self._last_strength_bar = None
+        self._last_strength_text = None
+        self._last_strength_fg = None
+        self._last_metric_values = {}
+        
+        # Dialog reused by show_message, built on first use
+        self.message_dialog = None
+        
+        # Worker pool for analysis / scans / reports (see run_in_background);
+        # finished jobs wait in _results for the Tk thread (_poll_results)
+        self.executor = ThreadPoolExecutor(max_workers=2)
+        self._results = queue.Queue()
+        self._jobs = 0
+        self._poll_id = None
+        
         # Set window background
         self.root.configure(bg=self.colors['dark_bg'])
         
@@ -380,6 +912,95 @@ class SentinelGUI:
         # Bind F1-F5 keys
         self.bind_hotkeys()
     
+    def run_in_background(self, func, on_done, on_error=None):
+        """Run func on the worker pool, then on_done(result) on the Tk thread
+        
+        Errors go to on_error(exception) if given, else are reported like a
+        normal Tk callback error. Worker threads never call into Tk: they
+        queue the finished future, which _poll_results picks up.
+        """
+        self._jobs += 1
+        self.executor.submit(func).add_done_callback(
+            lambda future: self._results.put((future, on_done, on_error)))
+        if self._poll_id is None:
+            self._poll_id = self.root.after(self.POLL_MS, self._poll_results)
+    
+    def _poll_results(self):
+        """Run the callbacks of finished background jobs (Tk thread)
+        
+        Re-arms itself every POLL_MS while jobs are outstanding and stops
+        once none are, so an idle GUI has no polling timer at all.
+        """
+        self._poll_id = None
+        while True:
+            try:
+                future, on_done, on_error = self._results.get_nowait()
+            except queue.Empty:
+                break
+            self._jobs -= 1
+            exc = future.exception()
+            try:
+                if exc is None:
+                    on_done(future.result())
+                elif on_error is not None:
+                    on_error(exc)
+                else:
+                    self.root.report_callback_exception(type(exc), exc, exc.__traceback__)
+            except Exception:
+                # Report like a normal Tk callback, without stopping the others
+                self.root.report_callback_exception(*sys.exc_info())
+        
+        if self._jobs:
+            self._poll_id = self.root.after(self.POLL_MS, self._poll_results)
+    
+    def schedule_animation(self, interval_ms, callback):
+        """Run callback now and then every interval_ms from the shared tick
+        
+        A callback that returns False is unregistered.
+        """
+        if callback() is False:
+            return
+        self.animations.append([time.monotonic() * 1000 + interval_ms, interval_ms, callback])
+        self._schedule_tick()
+    
+    def _schedule_tick(self):
+        """(Re)arm the single after() for the earliest due animation"""
+        if self._tick_id is not None:
+            self.root.after_cancel(self._tick_id)
+            self._tick_id = None
+        if self.animations:
+            next_due = min(entry[0] for entry in self.animations)
+            delay = max(1, int(next_due - time.monotonic() * 1000))
+            self._tick_id = self.root.after(delay, self._tick)
+    
+    def _tick(self):
+        """Run every due animation, then let Tk repaint once
+        
+        While the window is minimized or withdrawn, due animations are only
+        pushed back by their interval; there is nothing to see.
+        """
+        self._tick_id = None
+        now = time.monotonic() * 1000
+        hidden = self.root.state() in ('iconic', 'withdrawn')
+        for entry in list(self.animations):
+            if entry[0] > now:
+                continue
+            entry[0] = now + entry[1]
+            if hidden:
+                continue
+            try:
+                keep = entry[2]() is not False
+            except Exception:
+                # Report like a normal Tk callback, without stopping the others
+                self.root.report_callback_exception(*sys.exc_info())
+                keep = False
+            if not keep:
+                self.animations.remove(entry)
+        
+        if not hidden:
+            self.root.update_idletasks()
+        self._schedule_tick()
+    
     def setup_main_container(self):
         """Setup main container with futuristic styling"""
         # Main container
@@ -460,14 +1081,13 @@ class SentinelGUI:
         self.subtitle_text.pack(anchor='w')
         
         # Animate status
-        self.animate_status()
+        self.schedule_animation(1000, self.animate_status)
     
     def animate_status(self):
         """Animate status blinking"""
         current_color = self.status_label.cget('foreground')
         new_color = self.colors['dark_bg'] if current_color == self.colors['matrix_green'] else self.colors['matrix_green']
         self.status_label.config(fg=new_color)
-        self.root.after(1000, self.animate_status)
     
     def create_cyber_sidebar(self):
         """Create cyberpunk sidebar with red/green accents"""
@@ -501,13 +1121,18 @@ class SentinelGUI:
                 font=('Consolas', 12, 'bold')).pack(anchor='w', pady=(0, 10))
         
         stats_data = [
-            ("PASSWORDS ANALYZED", self.stats['passwords_analyzed'], "units"),
-            ("NETWORKS SCANNED", self.stats['networks_scanned'], "targets"),
-            ("THREATS DETECTED", self.stats['breaches_found'], "alerts"),
-            ("REPORTS GENERATED", self.stats['reports_generated'], "files"),
+            ("PASSWORDS ANALYZED", 'passwords_analyzed', "units"),
+            ("NETWORKS SCANNED", 'networks_scanned', "targets"),
+            ("THREATS DETECTED", 'breaches_found', "alerts"),
+            ("REPORTS GENERATED", 'reports_generated', "files"),
         ]
         
-        for label, value, unit in stats_data:
+        # Readouts are bound to StringVars so bump_stat() can update them
+        self.stat_vars = {}
+        self.stat_labels = {}
+        self.stat_units = {}
+        for label, key, unit in stats_data:
+            value = self.stats[key]
             stat_frame = tk.Frame(stats_frame, bg=self.colors['panel_bg'])
             stat_frame.pack(fill='x', pady=3)
             
@@ -518,11 +1143,14 @@ class SentinelGUI:
                     font=('Consolas', 9)).pack(side='left')
             
             value_color = self.colors['matrix_green'] if value > 0 else self.colors['text_dim']
-            tk.Label(stat_frame,
-                    text=f" {value:03d} {unit}",
+            self.stat_vars[key] = tk.StringVar(value=f" {value:03d} {unit}")
+            self.stat_units[key] = unit
+            self.stat_labels[key] = tk.Label(stat_frame,
+                    textvariable=self.stat_vars[key],
                     bg=self.colors['panel_bg'],
                     fg=value_color,
-                    font=('Consolas', 10, 'bold')).pack(side='right')
+                    font=('Consolas', 10, 'bold'))
+            self.stat_labels[key].pack(side='right')
         
         # Quick actions panel
         actions_frame = tk.Frame(sidebar, bg=self.colors['panel_bg'])
@@ -574,6 +1202,14 @@ class SentinelGUI:
         self.create_system_gauge(monitor_frame, "NETWORK", 42, self.colors['cyber_blue'])
         self.create_system_gauge(monitor_frame, "SECURITY", 92, self.colors['alert_red'])
     
+    def bump_stat(self, key):
+        """Increment a stats counter and refresh its sidebar readout"""
+        self.stats[key] += 1
+        value = self.stats[key]
+        self.stat_vars[key].set(f" {value:03d} {self.stat_units[key]}")
+        if value == 1:
+            self.stat_labels[key].config(fg=self.colors['matrix_green'])
+    
     def create_system_gauge(self, parent, label, value, color):
         """Create system gauge"""
         frame = tk.Frame(parent, bg=self.colors['panel_bg'])
@@ -625,37 +1261,67 @@ class SentinelGUI:
                  background=[('selected', self.colors['panel_bg'])],
                  foreground=[('selected', self.colors['matrix_green'])],
                  lightcolor=[('selected', self.colors['matrix_green'])])
+        # Network scanner tree
+        style.configure('Network.Treeview',
+                       background=self.colors['darker_bg'],
+                       foreground=self.colors['text_secondary'],
+                       fieldbackground=self.colors['darker_bg'],
+                       font=('Consolas', 10))
+        style.configure('Network.Treeview.Heading',
+                       background=self.colors['dark_bg'],
+                       foreground=self.colors['alert_red'],
+                       font=('Orbitron', 11, 'bold'))
         
         self.notebook = ttk.Notebook(notebook_frame, style='Cyber.TNotebook')
         self.notebook.pack(fill='both', expand=True)
         
-        # Create tabs with futuristic styling
-        self.create_password_tab()
-        self.create_wifi_tab()
-        self.create_generator_tab()
-        self.create_reports_tab()
-        self.create_dashboard_tab()
+        # Tabs start as empty frames and are filled in on first select
+        # (see add_tab / _on_tab_change)
+        self._tab_builders = {}
+        self.add_tab("🔐 PASSWORD ANALYZER", self.create_password_tab)
+        self.add_tab("📡 NETWORK SCANNER", self.create_wifi_tab)
+        self.add_tab("🔑 KEY GENERATOR", self.create_generator_tab)
+        self.add_tab("📊 SECURITY REPORTS", self.create_reports_tab)
+        self.dashboard_tab = self.add_tab("📈 SECURITY DASHBOARD", self.create_dashboard_tab, 'dark_bg')
+        
+        self.notebook.bind('<<NotebookTabChanged>>', self._on_tab_change)
+        self._on_tab_change()
     
-    def create_password_tab(self):
-        """Create futuristic password analysis tab"""
-        tab = tk.Frame(self.notebook, bg=self.colors['panel_bg'])
-        self.notebook.add(tab, text="🔐 PASSWORD ANALYZER")
-        
-        # Title with red alert color
+    def add_tab(self, text, builder, bg_key='panel_bg'):
+        """Add an empty notebook tab that builder(tab) fills on first select"""
+        tab = tk.Frame(self.notebook, bg=self.colors[bg_key])
+        self.notebook.add(tab, text=text)
+        self._tab_builders[str(tab)] = (builder, tab)
+        return tab
+    
+    def _on_tab_change(self, event=None):
+        """Build the selected tab if needed; run only its background effect"""
+        selected = self.notebook.select()
+        if selected in self._tab_builders:
+            builder, tab = self._tab_builders.pop(selected)
+            builder(tab)
+        for tab, effect in self._effects.items():
+            effect.toggle(tab == selected)
+        self.flush_feed()
+    
+    def create_tab_title(self, tab, title, subtitle, color_key):
+        """Create the title and subtitle lines at the top of a tab"""
         title_frame = tk.Frame(tab, bg=self.colors['panel_bg'])
         title_frame.pack(fill='x', pady=(30, 20))
         
         tk.Label(title_frame,
-                text="PASSWORD STRENGTH ANALYZER",
-                bg=self.colors['panel_bg'],
-                fg=self.colors['alert_red'],
-                font=('Orbitron', 20, 'bold')).pack()
+                text=title,
+                fg=self.colors[color_key],
+                **self.styles['tab_title']).pack()
         
         tk.Label(title_frame,
-                text="Analyze cryptographic strength in real-time",
-                bg=self.colors['panel_bg'],
-                fg=self.colors['cyber_green'],
-                font=('Consolas', 11)).pack(pady=(5, 0))
+                text=subtitle,
+                **self.styles['tab_subtitle']).pack(pady=(5, 0))
+    
+    def create_password_tab(self, tab):
+        """Create futuristic password analysis tab"""
+        self.create_tab_title(tab, "PASSWORD STRENGTH ANALYZER",
+                              "Analyze cryptographic strength in real-time", 'alert_red')
         
         # Input area with glowing border
         input_frame = tk.Frame(tab, bg=self.colors['darker_bg'], 
@@ -666,8 +1332,7 @@ class SentinelGUI:
         tk.Label(input_frame,
                 text="ENTER PASSWORD FOR ANALYSIS:",
                 bg=self.colors['darker_bg'],
-                fg=self.colors['cyber_blue'],
-                font=('Consolas', 12, 'bold')).pack(pady=(20, 10))
+                **self.styles['field_label']).pack(pady=(20, 10))
         
         # Password entry with futuristic style
         self.password_entry = tk.Entry(input_frame,
@@ -734,6 +1399,7 @@ class SentinelGUI:
         bar_frame.pack(fill='x', pady=10)
         bar_frame.pack_propagate(False)
         
+        bar_frame.bind('<Configure>', self._on_strength_track_resize)
         self.strength_bar = tk.Frame(bar_frame, bg=self.colors['text_dim'], width=0)
         self.strength_bar.place(relheight=1.0)
         
@@ -776,26 +1442,10 @@ class SentinelGUI:
             
             self.metric_labels[label.split()[0].lower()] = value_label
     
-    def create_wifi_tab(self):
+    def create_wifi_tab(self, tab):
         """Create futuristic WiFi scanner tab"""
-        tab = tk.Frame(self.notebook, bg=self.colors['panel_bg'])
-        self.notebook.add(tab, text="📡 NETWORK SCANNER")
-        
-        # Title
-        title_frame = tk.Frame(tab, bg=self.colors['panel_bg'])
-        title_frame.pack(fill='x', pady=(30, 20))
-        
-        tk.Label(title_frame,
-                text="WIRELESS NETWORK PROBE",
-                bg=self.colors['panel_bg'],
-                fg=self.colors['warning_orange'],
-                font=('Orbitron', 20, 'bold')).pack()
-        
-        tk.Label(title_frame,
-                text="Scan and analyze nearby wireless networks",
-                bg=self.colors['panel_bg'],
-                fg=self.colors['cyber_green'],
-                font=('Consolas', 11)).pack(pady=(5, 0))
+        self.create_tab_title(tab, "WIRELESS NETWORK PROBE",
+                              "Scan and analyze nearby wireless networks", 'warning_orange')
         
         # Control panel
         control_frame = tk.Frame(tab, bg=self.colors['darker_bg'],
@@ -807,15 +1457,8 @@ class SentinelGUI:
         scan_btn = tk.Button(control_frame,
                             text="🌐 INITIATE NETWORK SWEEP",
                             command=self.scan_wifi,
-                            bg=self.colors['darker_bg'],
                             fg=self.colors['cyber_blue'],
-                            font=('Orbitron', 14, 'bold'),
-                            relief='raised',
-                            borderwidth=3,
-                            padx=40,
-                            pady=15,
-                            cursor='hand2',
-                            activebackground=self.colors['highlight'])
+                            **self.styles['big_button'])
         scan_btn.pack(pady=30)
         
         # Status display
@@ -830,63 +1473,80 @@ class SentinelGUI:
         network_frame = tk.Frame(tab, bg=self.colors['panel_bg'])
         network_frame.pack(fill='both', expand=True, padx=40, pady=(0, 20))
         
-        # Treeview with custom style
-        style = ttk.Style()
-        style.configure('Network.Treeview',
-                       background=self.colors['darker_bg'],
-                       foreground=self.colors['text_secondary'],
-                       fieldbackground=self.colors['darker_bg'],
-                       font=('Consolas', 10))
-        style.configure('Network.Treeview.Heading',
-                       background=self.colors['dark_bg'],
-                       foreground=self.colors['alert_red'],
-                       font=('Orbitron', 11, 'bold'))
-        
-        columns = ('SSID', 'SECURITY', 'SIGNAL', 'CHANNEL', 'THREAT')
+        # Treeview with custom style (configured in create_cyber_notebook)
         self.network_tree = ttk.Treeview(network_frame,
-                                        columns=columns,
+                                        columns=NETWORK_COLUMNS,
                                         show='headings',
                                         style='Network.Treeview',
                                         height=12)
         
-        # Configure columns
-        col_widths = {'SSID': 250, 'SECURITY': 150, 'SIGNAL': 100, 'CHANNEL': 100, 'THREAT': 120}
-        for col in columns:
-            self.network_tree.heading(col, text=col)
-            self.network_tree.column(col, width=col_widths[col])
-        
-        # Scrollbar
-        scrollbar = ttk.Scrollbar(network_frame,
+        # Configure columns: every heading and width in one Tcl script
+        tree = self.network_tree
+        tree.tk.eval('\n'.join(
+            f'{tree} heading {col} -text {col}; {tree} column {col} -width {width}'
+            for col, width in zip(NETWORK_COLUMNS, NETWORK_COLUMN_WIDTHS)
+        ))
+        
+        # Scrollbar: the tree only ever holds the rows on screen, so the
+        # scrollbar moves a window over self.network_rows (see _vscroll)
+        self.network_rows = []
+        self._network_first = 0
+        self._network_visible = 12
+        self.network_scrollbar = ttk.Scrollbar(network_frame,
                                  orient='vertical',
-                                 command=self.network_tree.yview)
-        self.network_tree.configure(yscrollcommand=scrollbar.set)
+                                 command=self._vscroll)
+        self.network_scrollbar.set(0, 1)
         
         self.network_tree.pack(side='left', fill='both', expand=True)
-        scrollbar.pack(side='right', fill='y')
+        self.network_scrollbar.pack(side='right', fill='y')
         
-        # Bind selection
+        # Bind selection and wheel scrolling
         self.network_tree.bind('<<TreeviewSelect>>', self.on_network_select)
+        self.network_tree.bind('<MouseWheel>', lambda e: self._vscroll('scroll', -e.delta // 120, 'units'))
+        self.network_tree.bind('<Button-4>', lambda e: self._vscroll('scroll', -1, 'units'))
+        self.network_tree.bind('<Button-5>', lambda e: self._vscroll('scroll', 1, 'units'))
     
-    def create_generator_tab(self):
+    def _vscroll(self, *args):
+        """Scrollbar command: move the visible window over the network rows"""
+        total = len(self.network_rows)
+        visible = self._network_visible
+        if args[0] == 'moveto':
+            first = round(float(args[1]) * total)
+        else:  # 'scroll', count, 'units' | 'pages'
+            first = self._network_first + int(args[1]) * (visible if args[2] == 'pages' else 1)
+        first = max(0, min(first, total - visible))
+        if first != self._network_first:
+            self._network_first = first
+            self._refresh_visible()
+        return 'break'
+    
+    def _refresh_visible(self):
+        """Show the current window of network rows in the tree"""
+        tree = self.network_tree
+        first = self._network_first
+        rows = self.network_rows[first:first + self._network_visible]
+        
+        # Reuse the existing items; only their number changes with the data
+        items = tree.get_children()
+        tree_item = tree.item
+        for item, row in zip(items, rows):
+            tree_item(item, values=row)
+        if len(items) > len(rows):
+            tree.delete(*items[len(rows):])
+        tree_insert = tree.insert
+        for row in rows[len(items):]:
+            tree_insert('', 'end', values=row)
+        
+        total = len(self.network_rows)
+        if total:
+            self.network_scrollbar.set(first / total, (first + len(rows)) / total)
+        else:
+            self.network_scrollbar.set(0, 1)
+    
+    def create_generator_tab(self, tab):
         """Create futuristic password generator tab"""
-        tab = tk.Frame(self.notebook, bg=self.colors['panel_bg'])
-        self.notebook.add(tab, text="🔑 KEY GENERATOR")
-        
-        # Title
-        title_frame = tk.Frame(tab, bg=self.colors['panel_bg'])
-        title_frame.pack(fill='x', pady=(30, 20))
-        
-        tk.Label(title_frame,
-                text="CRYPTOGRAPHIC KEY GENERATOR",
-                bg=self.colors['panel_bg'],
-                fg=self.colors['neon_green'],
-                font=('Orbitron', 20, 'bold')).pack()
-        
-        tk.Label(title_frame,
-                text="Generate quantum-resistant passwords and keys",
-                bg=self.colors['panel_bg'],
-                fg=self.colors['cyber_green'],
-                font=('Consolas', 11)).pack(pady=(5, 0))
+        self.create_tab_title(tab, "CRYPTOGRAPHIC KEY GENERATOR",
+                              "Generate quantum-resistant passwords and keys", 'neon_green')
         
         # Configuration panel
         config_frame = tk.Frame(tab, bg=self.colors['darker_bg'],
@@ -901,8 +1561,7 @@ class SentinelGUI:
         tk.Label(length_frame,
                 text="KEY LENGTH:",
                 bg=self.colors['darker_bg'],
-                fg=self.colors['cyber_blue'],
-                font=('Consolas', 12, 'bold')).pack(side='left')
+                **self.styles['field_label']).pack(side='left')
         
         self.length_var = tk.IntVar(value=16)
         self.length_label = tk.Label(length_frame,
@@ -934,8 +1593,7 @@ class SentinelGUI:
         tk.Label(sets_frame,
                 text="CHARACTER SETS:",
                 bg=self.colors['darker_bg'],
-                fg=self.colors['cyber_blue'],
-                font=('Consolas', 12, 'bold')).pack(anchor='w', pady=(0, 10))
+                **self.styles['field_label']).pack(anchor='w', pady=(0, 10))
         
         sets_grid = tk.Frame(sets_frame, bg=self.colors['darker_bg'])
         sets_grid.pack()
@@ -959,6 +1617,7 @@ class SentinelGUI:
             tk.Checkbutton(frame,
                           text=text,
                           variable=var,
+                          command=lambda bit=1 << i: self.toggle_charset(bit),
                           bg=self.colors['darker_bg'],
                           fg=self.colors[color_key],
                           font=('Consolas', 10),
@@ -969,15 +1628,8 @@ class SentinelGUI:
         tk.Button(config_frame,
                  text="⚡ GENERATE SECURE KEY",
                  command=self.generate_password,
-                 bg=self.colors['darker_bg'],
                  fg=self.colors['neon_green'],
-                 font=('Orbitron', 14, 'bold'),
-                 relief='raised',
-                 borderwidth=3,
-                 padx=40,
-                 pady=15,
-                 cursor='hand2',
-                 activebackground=self.colors['highlight']).pack(pady=30)
+                 **self.styles['big_button']).pack(pady=30)
         
         # Generated key display
         output_frame = tk.Frame(tab, bg=self.colors['panel_bg'])
@@ -986,14 +1638,12 @@ class SentinelGUI:
         tk.Label(output_frame,
                 text="GENERATED KEY:",
                 bg=self.colors['panel_bg'],
-                fg=self.colors['cyber_blue'],
-                font=('Consolas', 12, 'bold')).pack(anchor='w', pady=(0, 10))
+                **self.styles['field_label']).pack(anchor='w', pady=(0, 10))
         
         # Key display with futuristic border
         key_frame = tk.Frame(output_frame, bg=self.colors['matrix_green'])
         key_frame.pack(fill='x', pady=10)
         
-        self.generated_key_var = tk.StringVar()
         key_display = tk.Entry(key_frame,
                               textvariable=self.generated_key_var,
                               font=('Consolas', 16, 'bold'),
@@ -1019,104 +1669,50 @@ class SentinelGUI:
         for text, color, command in buttons:
             tk.Button(action_frame,
                      text=text,
-                     command=command,
-                     bg=self.colors['darker_bg'],
-                     fg=color,
-                     font=('Consolas', 10, 'bold'),
-                     padx=20,
-                     pady=8,
-                     cursor='hand2',
-                     activebackground=self.colors['highlight']).pack(side='left', padx=5)
-    
-    def create_reports_tab(self):
-        """Create futuristic reports tab"""
-        tab = tk.Frame(self.notebook, bg=self.colors['panel_bg'])
-        self.notebook.add(tab, text="📊 SECURITY REPORTS")
-        
-        # Title
-        title_frame = tk.Frame(tab, bg=self.colors['panel_bg'])
-        title_frame.pack(fill='x', pady=(30, 20))
-        
-        tk.Label(title_frame,
-                text="SECURITY ANALYTICS & REPORTS",
-                bg=self.colors['panel_bg'],
-                fg=self.colors['alert_red'],
-                font=('Orbitron', 20, 'bold')).pack()
-        
-        tk.Label(title_frame,
-                text="Generate comprehensive security assessments",
-                bg=self.colors['panel_bg'],
-                fg=self.colors['cyber_green'],
-                font=('Consolas', 11)).pack(pady=(5, 0))
+                     command=command,
+                     bg=self.colors['darker_bg'],
+                     fg=color,
+                     font=('Consolas', 10, 'bold'),
+                     padx=20,
+                     pady=8,
+                     cursor='hand2',
+                     activebackground=self.colors['highlight']).pack(side='left', padx=5)
+    
+    def create_reports_tab(self, tab):
+        """Create futuristic reports tab"""
+        self.create_tab_title(tab, "SECURITY ANALYTICS & REPORTS",
+                              "Generate comprehensive security assessments", 'alert_red')
         
         # Report cards grid
         grid_frame = tk.Frame(tab, bg=self.colors['panel_bg'])
         grid_frame.pack(pady=20)
         
-        reports = [
-            ("🔐", "PASSWORD AUDIT", "Analyze password security posture", self.generate_password_report),
-            ("📡", "NETWORK ANALYSIS", "Wireless security assessment", self.generate_wifi_report),
-            ("📈", "SYSTEM DIAGNOSTICS", "Complete system vulnerability scan", self.generate_dashboard_report),
-            ("⚠️", "THREAT DETECTION", "Active threat identification", self.generate_threat_report),
-            ("🛡️", "FIREWALL ANALYSIS", "Network protection audit", self.generate_firewall_report),
-            ("🔍", "FORENSIC REPORT", "Advanced forensic analysis", self.generate_forensic_report),
-        ]
-        
-        for i, (icon, title, desc, command) in enumerate(reports):
-            row, col = divmod(i, 3)
-            
-            card = tk.Frame(grid_frame,
-                           bg=self.colors['darker_bg'],
-                           relief='raised',
-                           borderwidth=2,
-                           width=280,
-                           height=180)
-            card.grid(row=row, column=col, padx=10, pady=10, sticky='nsew')
-            card.grid_propagate(False)
-            
-            # Icon with color based on report type
-            icon_color = self.colors['matrix_green'] if i % 2 == 0 else self.colors['alert_red']
-            tk.Label(card,
-                    text=icon,
-                    font=('Segoe UI', 32),
-                    bg=self.colors['darker_bg'],
-                    fg=icon_color).pack(pady=(20, 5))
-            
-            # Title
-            tk.Label(card,
-                    text=title,
-                    font=('Orbitron', 12, 'bold'),
-                    bg=self.colors['darker_bg'],
-                    fg=self.colors['text_primary']).pack()
-            
-            # Description
-            tk.Label(card,
-                    text=desc,
-                    font=('Consolas', 8),
-                    bg=self.colors['darker_bg'],
-                    fg=self.colors['text_secondary'],
-                    wraplength=250).pack(pady=5)
-            
-            # Generate button
-            btn_color = self.colors['matrix_green'] if i % 2 == 0 else self.colors['alert_red']
-            btn = tk.Button(card,
-                           text="⚡ GENERATE REPORT",
-                           command=command,
-                           bg=self.colors['dark_bg'],
-                           fg=btn_color,
-                           font=('Consolas', 9, 'bold'),
-                           padx=10,
-                           pady=5,
-                           cursor='hand2')
-            btn.pack(pady=10)
-    
-    def create_dashboard_tab(self):
+        # Icon and button color alternate between green and red
+        accents = (self.colors['matrix_green'], self.colors['alert_red'])
+        for i, report in enumerate(REPORT_CARDS):
+            self.create_report_card(grid_frame, *divmod(i, 3), report, accents[i % 2])
+    
+    def create_report_card(self, parent, row, col, report, accent):
+        """Create one report card (a ReportCard) in the reports grid"""
+        # The card has a fixed size and its contents are placed at fixed
+        # spots, so adding them never sends a resize back up to the grid
+        card = tk.Frame(parent, **self.styles['card'])
+        card.grid(row=row, column=col, padx=10, pady=10)
+        
+        tk.Label(card, text=report.icon, fg=accent,
+                 **self.styles['card_icon']).place(relx=0.5, y=12, anchor='n')
+        tk.Label(card, text=report.title,
+                 **self.styles['card_title']).place(relx=0.5, y=70, anchor='n')
+        tk.Label(card, text=report.desc,
+                 **self.styles['card_desc']).place(relx=0.5, y=96, anchor='n')
+        tk.Button(card, command=getattr(self, report.handler), fg=accent,
+                  **self.styles['card_button']).place(relx=0.5, y=126, anchor='n')
+    
+    def create_dashboard_tab(self, tab):
         """Create futuristic dashboard tab"""
-        tab = tk.Frame(self.notebook, bg=self.colors['dark_bg'])
-        self.notebook.add(tab, text="📈 SECURITY DASHBOARD")
-        
         # Add digital rain background
-        self.digital_rain = DigitalRainWidget(tab, 1400, 900)
+        self.digital_rain = DigitalRainWidget(tab, 1400, 900, scheduler=self.schedule_animation)
+        self._effects[str(tab)] = self.digital_rain
         
         # Dashboard content on top
         self.create_dashboard_content(tab)
@@ -1155,24 +1751,35 @@ class SentinelGUI:
                 fg=self.colors['alert_red'],
                 font=('Orbitron', 14, 'bold')).pack(pady=10)
         
-        self.feed_text = scrolledtext.ScrolledText(feed_frame,
-                                                  width=80,
-                                                  height=12,
-                                                  bg='#000000',
-                                                  fg=self.colors['matrix_green'],
-                                                  font=('Consolas', 10),
-                                                  insertbackground=self.colors['matrix_green'])
-        self.feed_text.pack(padx=10, pady=10)
-        self.feed_text.insert('1.0', "> SYSTEM INITIALIZED... [OK]\n")
-        self.feed_text.insert('2.0', "> SECURITY MODULES LOADED... [OK]\n")
-        self.feed_text.insert('3.0', "> NETWORK SCANNER READY... [OK]\n")
-        self.feed_text.insert('4.0', "> PASSWORD ANALYZER ONLINE... [OK]\n")
-        self.feed_text.insert('5.0', "> THREAT DETECTION ACTIVE... [OK]\n")
-        self.feed_text.insert('6.0', "> ALL SYSTEMS OPERATIONAL... [OK]\n")
-        self.feed_text.config(state='disabled')
+        # One Listbox row per feed line: appending and trimming rows stays
+        # cheap however long the feed runs, unlike a growing Text
+        feed_box = tk.Frame(feed_frame, bg=self.colors['darker_bg'])
+        feed_box.pack(padx=10, pady=10)
+        self.feed_text = tk.Listbox(feed_box,
+                                   width=80,
+                                   height=12,
+                                   bg='#000000',
+                                   fg=self.colors['matrix_green'],
+                                   font=('Consolas', 10),
+                                   selectbackground=self.colors['highlight'],
+                                   selectforeground=self.colors['matrix_green'],
+                                   activestyle='none',
+                                   borderwidth=0,
+                                   highlightthickness=0)
+        feed_scrollbar = tk.Scrollbar(feed_box, command=self.feed_text.yview)
+        self.feed_text.config(yscrollcommand=feed_scrollbar.set)
+        self.feed_text.pack(side='left')
+        feed_scrollbar.pack(side='right', fill='y')
+        self.feed_text.insert('end',
+                              "> SYSTEM INITIALIZED... [OK]",
+                              "> SECURITY MODULES LOADED... [OK]",
+                              "> NETWORK SCANNER READY... [OK]",
+                              "> PASSWORD ANALYZER ONLINE... [OK]",
+                              "> THREAT DETECTION ACTIVE... [OK]",
+                              "> ALL SYSTEMS OPERATIONAL... [OK]")
         
         # Update feed periodically
-        self.update_security_feed()
+        self.schedule_animation(5000, self.update_security_feed)
     
     def create_cyber_footer(self):
         """Create cyberpunk footer"""
@@ -1184,9 +1791,11 @@ class SentinelGUI:
         footer_frame.pack(fill='x', side='bottom', pady=(2, 0))
         footer_frame.pack_propagate(False)
         
-        # Status bar with system info
+        # Status bar with system info; update_clock appends the time to
+        # the current status, kept here so the label is never read back
+        self._status_prefix = ">_ GRAE-X SENTINEL PRO v4.2.1 | READY "
         self.status_bar = tk.Label(footer_frame,
-                                  text=f">_ GRAE-X SENTINEL PRO v4.2.1 | READY | {datetime.now().strftime('%H:%M:%S')}",
+                                  text=f"{self._status_prefix}| {time.strftime('%H:%M:%S')}",
                                   bg=self.colors['darker_bg'],
                                   fg=self.colors['cyber_green'],
                                   font=('Consolas', 10))
@@ -1216,7 +1825,7 @@ class SentinelGUI:
                     font=('Consolas', 9, 'bold')).pack(side='left', padx=(0, 10))
         
         # Update clock
-        self.update_clock()
+        self.schedule_animation(1000, self.update_clock)
     
     def setup_cyber_menu(self):
         """Setup cyberpunk menu"""
@@ -1227,135 +1836,120 @@ class SentinelGUI:
                          activeforeground=self.colors['matrix_green'])
         self.root.config(menu=menubar)
         
-        # File menu
-        file_menu = tk.Menu(menubar, tearoff=0,
-                           bg=self.colors['darker_bg'],
-                           fg=self.colors['text_secondary'])
-        menubar.add_cascade(label="[FILE]", menu=file_menu)
-        file_menu.add_command(label="NEW ANALYSIS SESSION", command=self.new_analysis)
-        file_menu.add_command(label="LOAD SECURITY REPORT", command=self.open_report)
-        file_menu.add_separator()
-        file_menu.add_command(label="EXPORT ALL DATA", command=self.export_data)
-        file_menu.add_separator()
-        file_menu.add_command(label="EXIT SYSTEM", command=self.root.quit)
-        
-        # Tools menu
-        tools_menu = tk.Menu(menubar, tearoff=0,
-                            bg=self.colors['darker_bg'],
-                            fg=self.colors['text_secondary'])
-        menubar.add_cascade(label="[TOOLS]", menu=tools_menu)
-        tools_menu.add_command(label="BATCH PASSWORD ANALYSIS", command=self.batch_password_check)
-        tools_menu.add_command(label="ADVANCED NETWORK SCAN", command=self.advanced_network_scan)
-        tools_menu.add_separator()
-        tools_menu.add_command(label="TOGGLE MATRIX EFFECT", command=self.toggle_matrix)
-        tools_menu.add_command(label="CHANGE THEME", command=self.change_theme)
-        
-        # Help menu
-        help_menu = tk.Menu(menubar, tearoff=0,
-                           bg=self.colors['darker_bg'],
-                           fg=self.colors['text_secondary'])
-        menubar.add_cascade(label="[HELP]", menu=help_menu)
-        help_menu.add_command(label="USER GUIDE", command=self.show_guide)
-        help_menu.add_command(label="KEYBOARD SHORTCUTS", command=self.show_shortcuts)
-        help_menu.add_separator()
-        help_menu.add_command(label="ABOUT GRAE-X SENTINEL", command=self.show_about)
+        # Submenus share one option set; items come from MENUS
+        menu_style = dict(tearoff=0,
+                          bg=self.colors['darker_bg'],
+                          fg=self.colors['text_secondary'])
+        for label, items in MENUS:
+            menu = tk.Menu(menubar, **menu_style)
+            menubar.add_cascade(label=label, menu=menu)
+            for item in items:
+                if item is None:
+                    menu.add_separator()
+                else:
+                    menu.add_command(label=item[0], command=attrgetter(item[1])(self))
     
     def bind_hotkeys(self):
         """Bind hotkeys for quick access"""
-        self.root.bind('<F1>', lambda e: self.notebook.select(0))
-        self.root.bind('<F2>', lambda e: self.notebook.select(1))
-        self.root.bind('<F3>', lambda e: self.notebook.select(2))
-        self.root.bind('<F4>', lambda e: self.notebook.select(3))
-        self.root.bind('<F5>', lambda e: self.notebook.select(4))
+        # F1-F5 select a tab: bound to Tcl scripts, so the key press itself
+        # runs no Python (the tab change event still reaches _on_tab_change)
+        for index in range(5):
+            self.root.bind(f'<F{index + 1}>', f'{self.notebook} select {index}')
         self.root.bind('<Control-n>', lambda e: self.new_analysis())
         self.root.bind('<Control-s>', lambda e: self.save_password())
         self.root.bind('<Control-q>', lambda e: self.root.quit())
     
     def update_clock(self):
         """Update footer clock"""
-        time_str = datetime.now().strftime("%H:%M:%S")
-        current_text = self.status_bar.cget('text')
-        if "READY |" in current_text:
-            new_text = f">_ GRAE-X SENTINEL PRO v4.2.1 | READY | {time_str}"
-        else:
-            new_text = current_text.rsplit('|', 1)[0] + f"| {time_str}"
-        self.status_bar.config(text=new_text)
-        self.root.after(1000, self.update_clock)
+        self.status_bar.config(text=f"{self._status_prefix}| {time.strftime('%H:%M:%S')}")
+    
+    def set_status(self, text):
+        """Show a status message; the clock adds the time on its next tick"""
+        self._status_prefix = text
+        self.status_bar.config(text=text)
     
     def update_security_feed(self):
         """Update security feed with random messages"""
-        messages = [
-            "> SCANNING FOR NETWORK THREATS... CLEAR",
-            "> FIREWALL PROTECTION: ACTIVE",
-            "> ENCRYPTION MODULE: OPERATIONAL",
-            "> INTRUSION DETECTION: ONLINE",
-            "> SYSTEM INTEGRITY CHECK: 100%",
-            "> NETWORK TRAFFIC ANALYSIS: NORMAL",
-            "> MALWARE SCAN: NO THREATS DETECTED",
-            "> BACKUP SYSTEM: VERIFIED AND SECURE",
-            "> USER ACTIVITY MONITORING: ACTIVE",
-            "> SECURITY PATCHES: UP TO DATE",
-        ]
-        
         if random.random() > 0.8:  # 20% chance to add message
-            self.feed_text.config(state='normal')
-            self.feed_text.insert('end', random.choice(messages) + '\n')
-            self.feed_text.see('end')
-            self.feed_text.config(state='disabled')
+            self.log_feed(random.choice(self.FEED_MESSAGES))
+    
+    def log_feed(self, message):
+        """Add a line to the live security feed"""
+        self._feed_pending.append(message)
+        self.flush_feed()
+    
+    def flush_feed(self):
+        """Write pending feed lines, while the dashboard tab is shown
+        
+        The feed sits on the dashboard, so lines logged from other tabs are
+        held back and written together once it is selected. Only the last
+        FEED_MAX_LINES lines are kept.
+        """
+        if not self._feed_pending or self.notebook.select() != str(self.dashboard_tab):
+            return
         
-        self.root.after(5000, self.update_security_feed)
+        pending = self._feed_pending[-self.FEED_MAX_LINES:]
+        self._feed_pending.clear()
+        self.feed_text.insert('end', *pending)
+        excess = self.feed_text.size() - self.FEED_MAX_LINES
+        if excess > 0:
+            self.feed_text.delete(0, excess - 1)
+        self.feed_text.yview_moveto(1.0)
     
     # Event handlers and functionality
     def on_password_change(self, event=None):
         """Handle password change"""
-        password = self.password_entry.get()
-        self.current_password = password
+        self.current_password = self.password_entry.get()
         
-        if password and len(password) > 0:
-            # Update strength indicator in real-time
+        # Debounced: the meter updates once typing pauses for 200 ms
+        if self._strength_after_id is not None:
+            self.root.after_cancel(self._strength_after_id)
+        self._strength_after_id = self.root.after(200, self.update_live_strength)
+    
+    def update_live_strength(self):
+        """Update the strength indicator for the password being typed"""
+        self._strength_after_id = None
+        password = self.current_password
+        if password:
             score = min(len(password) * 6, 100)  # Simple scoring
             self.update_strength_display(score)
     
+    def _on_strength_track_resize(self, event):
+        """Remember the strength track width for update_strength_display"""
+        self._strength_track_width = event.width
+    
     def update_strength_display(self, score):
         """Update password strength display"""
         # Update strength bar
-        if hasattr(self, 'strength_bar'):
-            bar_width = int((score / 100) * self.strength_bar.master.winfo_width())
-            self.strength_bar.config(width=bar_width)
+        bar = self.strength_bar
+        if bar is not None:
+            bar_width = int((score / 100) * self._strength_track_width)
             
-            # Set color based on score
-            if score >= 80:
-                color = self.colors['matrix_green']
-                strength = "IMPENETRABLE"
-            elif score >= 60:
-                color = self.colors['cyber_blue']
-                strength = "STRONG"
-            elif score >= 40:
-                color = self.colors['warning_orange']
-                strength = "MODERATE"
-            elif score >= 20:
-                color = "#FF6600"
-                strength = "WEAK"
-            else:
-                color = self.colors['alert_red']
-                strength = "CRITICAL"
-            
-            self.strength_bar.config(bg=color)
+            # Set color based on score (first bucket the score reaches)
+            for threshold, color, strength in self._strength_table:
+                if score >= threshold:
+                    break
             
-            if hasattr(self, 'strength_label'):
-                self.strength_label.config(text=f"[{strength}] SCORE: {score}/100", fg=color)
-        
-        # Update metrics
-        metrics = {
-            'entropy': f"{score * 2.5:.1f} bits",
-            'crack': "YEARS" if score > 60 else "DAYS" if score > 30 else "HOURS" if score > 10 else "MINUTES",
-            'pattern': "COMPLEX" if score > 70 else "MODERATE" if score > 40 else "SIMPLE",
-            'breach': "SAFE" if score > 80 else "RISK" if score > 50 else "VULNERABLE"
-        }
-        
-        for key in ['entropy', 'crack', 'pattern', 'breach']:
-            if key in self.metric_labels:
-                self.metric_labels[key].config(text=metrics[key])
+            if (bar_width, color) != self._last_strength_bar:
+                bar.config(width=bar_width, bg=color)
+                self._last_strength_bar = (bar_width, color)
+            text = f"[{strength}] SCORE: {score}/100"
+            # Text changes with every score, the color only with the bucket
+            options = {}
+            if text != self._last_strength_text:
+                options['text'] = text
+            if color != self._last_strength_fg:
+                options['fg'] = color
+            if options:
+                self.strength_label.config(**options)
+                self._last_strength_text, self._last_strength_fg = text, color
+        
+        # Update metrics; only labels whose text changed are reconfigured
+        metrics = zip(('entropy', 'crack', 'pattern', 'breach'), strength_metrics(score))
+        for key, value in metrics:
+            if key in self.metric_labels and self._last_metric_values.get(key) != value:
+                self.metric_labels[key].config(text=value)
+                self._last_metric_values[key] = value
     
     def analyze_password(self):
         """Analyze password"""
@@ -1364,15 +1958,14 @@ class SentinelGUI:
             self.show_message("ALERT", "NO PASSWORD INPUT DETECTED", "alert_red")
             return
         
-        self.status_bar.config(text=f">_ ANALYZING PASSWORD: {'•' * min(len(password), 10)}...")
+        self.set_status(f">_ ANALYZING PASSWORD: {'•' * min(len(password), 10)}...")
         
         # Simulate analysis
         def analyze():
             time.sleep(1.5)
-            result = self.password_analyzer.analyze(password)
-            self.root.after(0, lambda: self.display_analysis_result(result))
+            return self.password_analyzer.analyze(password)
         
-        threading.Thread(target=analyze, daemon=True).start()
+        self.run_in_background(analyze, self.display_analysis_result)
     
     def display_analysis_result(self, result):
         """Display analysis result"""
@@ -1380,7 +1973,7 @@ class SentinelGUI:
         self.update_strength_display(score)
         
         # Update stats
-        self.stats['passwords_analyzed'] += 1
+        self.bump_stat('passwords_analyzed')
         
         # Show result message
         if score >= 80:
@@ -1397,13 +1990,10 @@ class SentinelGUI:
             color = "alert_red"
         
         self.show_message("ANALYSIS COMPLETE", message, color)
-        self.status_bar.config(text=">_ PASSWORD ANALYSIS COMPLETE")
+        self.set_status(">_ PASSWORD ANALYSIS COMPLETE")
         
         # Update feed
-        self.feed_text.config(state='normal')
-        self.feed_text.insert('end', f"> PASSWORD ANALYZED: SCORE {score}/100\n")
-        self.feed_text.see('end')
-        self.feed_text.config(state='disabled')
+        self.log_feed(f"> PASSWORD ANALYZED: SCORE {score}/100")
     
     def toggle_password_visibility(self):
         """Toggle password visibility"""
@@ -1419,60 +2009,46 @@ class SentinelGUI:
         
         self.scanning = True
         self.scan_status.config(text="⚡ SCANNING WIRELESS NETWORKS...", fg=self.colors['warning_orange'])
-        self.status_bar.config(text=">_ INITIATING NETWORK PROBE...")
+        self.set_status(">_ INITIATING NETWORK PROBE...")
         
         def scan():
-            try:
-                time.sleep(2)  # Simulate scanning
-                networks = self.wifi_scanner.scan()
-                self.root.after(0, lambda: self.display_scan_results(networks))
-            except Exception as e:
-                self.root.after(0, lambda: self.scan_failed(str(e)))
+            # Scanners differ in key case ('ssid' / 'SSID'); lower-case the
+            # keys here, off the UI thread, so the results are read directly
+            return [{key.lower(): value for key, value in net.items()}
+                    for net in self.wifi_scanner.scan()]
         
-        threading.Thread(target=scan, daemon=True).start()
+        self.run_in_background(scan, self.display_scan_results,
+                               lambda e: self.scan_failed(str(e)))
     
     def display_scan_results(self, networks):
         """Display WiFi scan results"""
         self.scanning = False
         self.current_networks = networks
         self.scan_status.config(text=f"✅ FOUND {len(networks)} NETWORKS", fg=self.colors['matrix_green'])
-        self.status_bar.config(text=">_ NETWORK SWEEP COMPLETE")
-        
-        # Clear tree
-        for item in self.network_tree.get_children():
-            self.network_tree.delete(item)
-        
-        # Add networks
-        for i, net in enumerate(networks, 1):
-            ssid = net.get('ssid', net.get('SSID', 'HIDDEN NETWORK'))
-            security = net.get('security', net.get('Security', 'UNKNOWN'))
-            signal = net.get('signal', net.get('Signal', 'N/A'))
-            channel = net.get('channel', net.get('Channel', 'N/A'))
-            
-            # Determine threat level
-            if 'WEP' in security.upper() or 'OPEN' in security.upper():
-                threat = "CRITICAL ⚠️"
-            elif 'WPA' in security.upper() and 'WPA2' not in security.upper():
-                threat = "HIGH ⚠️"
-            elif 'WPA2' in security.upper():
-                threat = "MEDIUM ⚠️"
-            elif 'WPA3' in security.upper():
-                threat = "LOW ✅"
-            else:
-                threat = "UNKNOWN ❓"
-            
-            self.network_tree.insert('', 'end', values=(
-                ssid, security, signal, channel, threat
+        self.set_status(">_ NETWORK SWEEP COMPLETE")
+        
+        # Row values for every network, worked out before touching the tree
+        rows = []
+        for net in networks:
+            security = net.get('security', 'UNKNOWN')
+            rows.append((
+                net.get('ssid', 'HIDDEN NETWORK'),
+                security,
+                net.get('signal', 'N/A'),
+                net.get('channel', 'N/A'),
+                threat_level(security)
             ))
         
+        # Only the rows on screen become tree items (see _refresh_visible)
+        self.network_rows = rows
+        self._network_first = 0
+        self._refresh_visible()
+        
         # Update stats
-        self.stats['networks_scanned'] += 1
+        self.bump_stat('networks_scanned')
         
         # Update feed
-        self.feed_text.config(state='normal')
-        self.feed_text.insert('end', f"> NETWORK SCAN COMPLETE: {len(networks)} NETWORKS FOUND\n")
-        self.feed_text.see('end')
-        self.feed_text.config(state='disabled')
+        self.log_feed(f"> NETWORK SCAN COMPLETE: {len(networks)} NETWORKS FOUND")
     
     def scan_failed(self, error):
         """Handle scan failure"""
@@ -1521,36 +2097,42 @@ SECURITY ASSESSMENT:"""
         """Generate password"""
         length = self.length_var.get()
         
+        mask = self._charset_mask
         password = self.password_generator.generate(
             length=length,
-            use_lower=self.use_lower.get(),
-            use_upper=self.use_upper.get(),
-            use_digits=self.use_digits.get(),
-            use_special=self.use_special.get()
+            **{flag: bool(mask & 1 << i) for i, flag in enumerate(self.CHARSET_FLAGS)}
         )
         
         # Display with typewriter effect
         self.typewriter_effect(password)
         
         # Update feed
-        self.feed_text.config(state='normal')
-        self.feed_text.insert('end', f"> GENERATED {length}-CHARACTER SECURE KEY\n")
-        self.feed_text.see('end')
-        self.feed_text.config(state='disabled')
+        self.log_feed(f"> GENERATED {length}-CHARACTER SECURE KEY")
         
-        self.status_bar.config(text=">_ CRYPTOGRAPHIC KEY GENERATED")
+        self.set_status(">_ CRYPTOGRAPHIC KEY GENERATED")
+    
+    def toggle_charset(self, bit):
+        """Mirror a character set checkbox into the charset bitmask"""
+        self._charset_mask ^= bit
     
     def typewriter_effect(self, text):
         """Display text with typewriter effect"""
+        # A new key replaces what is left of a previous one still being typed
+        self._typewriter_text = text
+        self._typewriter_pos = 0
         self.generated_key_var.set("")
-        
-        def type_char(i=0):
-            if i < len(text):
-                current = self.generated_key_var.get()
-                self.generated_key_var.set(current + text[i])
-                self.root.after(30, lambda: type_char(i + 1))
-        
-        type_char()
+        if self._typewriter_id is None:
+            self._typewriter_id = self.root.after(self.TYPEWRITER_MS, self._typewriter_tick)
+    
+    def _typewriter_tick(self):
+        """Show the next TYPEWRITER_STEP key characters until all are shown"""
+        text = self._typewriter_text
+        if self._typewriter_pos >= len(text):
+            self._typewriter_id = None
+            return
+        self._typewriter_pos += self.TYPEWRITER_STEP
+        self.generated_key_var.set(text[:self._typewriter_pos])
+        self._typewriter_id = self.root.after(self.TYPEWRITER_MS, self._typewriter_tick)
     
     def copy_password(self):
         """Copy password to clipboard"""
@@ -1570,188 +2152,150 @@ SECURITY ASSESSMENT:"""
                 filetypes=[("Text files", "*.txt"), ("Encrypted files", "*.enc"), ("All files", "*.*")]
             )
             if file_path:
+                vault = "\n".join([
+                    "=" * 60,
+                    "GRAE-X SENTINEL PRO - SECURE KEY VAULT",
+                    "=" * 60,
+                    f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}",
+                    f"Key Length: {len(password)} characters",
+                    f"Key Type: {'Full Spectrum' if self._charset_mask == self.CHARSET_ALL else 'Custom'}",
+                    "-" * 60,
+                    f"KEY: {password}",
+                    "-" * 60,
+                    "SECURITY NOTES:",
+                    "- Do not share this key",
+                    "- Store in encrypted password manager",
+                    "- Use for critical systems only",
+                    "=" * 60,
+                    "",
+                ])
                 try:
                     with open(file_path, 'w') as f:
-                        f.write("=" * 60 + "\n")
-                        f.write("GRAE-X SENTINEL PRO - SECURE KEY VAULT\n")
-                        f.write("=" * 60 + "\n")
-                        f.write(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
-                        f.write(f"Key Length: {len(password)} characters\n")
-                        f.write(f"Key Type: {'Full Spectrum' if all([self.use_lower.get(), self.use_upper.get(), self.use_digits.get(), self.use_special.get()]) else 'Custom'}\n")
-                        f.write("-" * 60 + "\n")
-                        f.write(f"KEY: {password}\n")
-                        f.write("-" * 60 + "\n")
-                        f.write("SECURITY NOTES:\n")
-                        f.write("- Do not share this key\n")
-                        f.write("- Store in encrypted password manager\n")
-                        f.write("- Use for critical systems only\n")
-                        f.write("=" * 60 + "\n")
+                        f.write(vault)
                     
                     self.show_message("SUCCESS", f"KEY SECURELY SAVED TO:\n{file_path}", "matrix_green")
                 except Exception as e:
                     self.show_message("ERROR", f"SAVE FAILED:\n{str(e)}", "alert_red")
     
     # Report generation methods
+    def report_ready(self, title, report, color_key):
+        """Show a report built in the background and count it"""
+        self.display_report(title, report, color_key)
+        self.bump_stat('reports_generated')
+    
     def generate_password_report(self):
         """Generate password security report"""
-        report = self.report_generator.generate_password_report()
-        self.display_report("PASSWORD SECURITY REPORT", report, "matrix_green")
-        self.stats['reports_generated'] += 1
+        self.run_in_background(
+            self.report_generator.generate_password_report,
+            lambda report: self.report_ready("PASSWORD SECURITY REPORT", report, "matrix_green"))
     
     def generate_wifi_report(self):
         """Generate WiFi security report"""
-        report = self.report_generator.generate_wifi_report(self.current_networks)
-        self.display_report("WIFI SECURITY REPORT", report, "cyber_blue")
-        self.stats['reports_generated'] += 1
+        networks = self.current_networks
+        self.run_in_background(
+            lambda: self.report_generator.generate_wifi_report(networks),
+            lambda report: self.report_ready("WIFI SECURITY REPORT", report, "cyber_blue"))
     
     def generate_dashboard_report(self):
         """Generate dashboard report"""
-        report = self.report_generator.generate_dashboard_report()
-        self.display_report("SYSTEM DASHBOARD REPORT", report, "warning_orange")
-        self.stats['reports_generated'] += 1
-    
-    def generate_threat_report(self):
-        """Generate threat report"""
-        report = """THREAT DETECTION REPORT
-━━━━━━━━━━━━━━━━━━━━━━━━
-SCAN TIME: {time}
-THREAT LEVEL: LOW
-DETECTED THREATS: 0
-PROTECTION STATUS: FULL
-
-ACTIVE PROTECTIONS:
-✓ Real-time malware scanning
-✓ Network intrusion detection
-✓ Firewall protection
-✓ Behavioral analysis
-✓ Automated threat response
-
-RECOMMENDATIONS:
-• Keep all software updated
-• Use multi-factor authentication
-• Regular security audits
-• Employee security training
-• Backup critical data regularly
-━━━━━━━━━━━━━━━━━━━━━━━━""".format(time=datetime.now().strftime('%Y-%m-%d %H:%M:%S'))
-        
-        self.display_report("THREAT DETECTION REPORT", report, "alert_red")
-        self.stats['reports_generated'] += 1
+        self.run_in_background(
+            self.report_generator.generate_dashboard_report,
+            lambda report: self.report_ready("SYSTEM DASHBOARD REPORT", report, "warning_orange"))
     
-    def generate_firewall_report(self):
-        """Generate firewall report"""
-        report = """FIREWALL ANALYSIS REPORT
-━━━━━━━━━━━━━━━━━━━━━━━━
-REPORT TIME: {time}
-FIREWALL STATUS: ACTIVE
-BLOCKED ATTEMPTS: 1,247
-ACTIVE RULES: 42
-
-TOP BLOCKED THREATS:
-1. Port scanning attempts
-2. Brute force attacks
-3. Malicious payloads
-4. SQL injection attempts
-5. Cross-site scripting
-
-RECOMMENDATIONS:
-✓ Firewall configuration optimal
-✓ Regular rule updates recommended
-✓ Consider advanced threat protection
-✓ Monitor for new attack vectors
-━━━━━━━━━━━━━━━━━━━━━━━━""".format(time=datetime.now().strftime('%Y-%m-%d %H:%M:%S'))
-        
-        self.display_report("FIREWALL ANALYSIS REPORT", report, "warning_orange")
-        self.stats['reports_generated'] += 1
+    def generate_static_report(self, key):
+        """Show one of the fixed STATIC_REPORTS, stamped with the current time"""
+        title, color_key, template = STATIC_REPORTS[key]
+        report = template.format(time=datetime.now().strftime('%Y-%m-%d %H:%M:%S'))
+        self.display_report(title, report, color_key)
+        self.bump_stat('reports_generated')
     
-    def generate_forensic_report(self):
-        """Generate forensic report"""
-        report = """DIGITAL FORENSIC REPORT
-━━━━━━━━━━━━━━━━━━━━━━━━
-ANALYSIS TIME: {time}
-SYSTEM: GRAE-X SENTINEL PRO
-ANALYST: AUTOMATED SYSTEM
-
-FINDINGS:
-• System integrity: 100%
-• No unauthorized access detected
-• All security logs intact
-• Encryption protocols active
-• No evidence of tampering
-
-RECOMMENDATIONS:
-• Continue regular monitoring
-• Maintain current security posture
-• Schedule quarterly audits
-• Update incident response plan
-━━━━━━━━━━━━━━━━━━━━━━━━""".format(time=datetime.now().strftime('%Y-%m-%d %H:%M:%S'))
-        
-        self.display_report("FORENSIC ANALYSIS REPORT", report, "matrix_green")
-        self.stats['reports_generated'] += 1
+    generate_threat_report = partialmethod(generate_static_report, 'threat')
+    generate_firewall_report = partialmethod(generate_static_report, 'firewall')
+    generate_forensic_report = partialmethod(generate_static_report, 'forensic')
     
     def display_report(self, title, content, color_key):
         """Display generated report"""
         self.show_message(title, content, color_key)
         
         # Update feed
-        self.feed_text.config(state='normal')
-        self.feed_text.insert('end', f"> {title} GENERATED\n")
-        self.feed_text.see('end')
-        self.feed_text.config(state='disabled')
+        self.log_feed(f"> {title} GENERATED")
         
-        self.status_bar.config(text=f">_ {title} GENERATED")
+        self.set_status(f">_ {title} GENERATED")
     
     def show_message(self, title, message, color_key="matrix_green"):
-        """Show futuristic styled message"""
-        dialog = tk.Toplevel(self.root)
+        """Show futuristic styled message
+        
+        The dialog is built once (see build_message_dialog) and then only
+        refilled and shown again; a message shown while it is open replaces
+        the one on screen.
+        """
+        if self.message_dialog is None:
+            self.build_message_dialog()
+        dialog = self.message_dialog
+        color = self.colors[color_key]
+        
         dialog.title(title)
-        dialog.geometry("600x400")
+        self.message_title.config(text=f"[ {title} ]", fg=color)
+        self.message_text.config(state='normal', fg=color, insertbackground=color)
+        self.message_text.delete('1.0', 'end')
+        self.message_text.insert('1.0', message)
+        self.message_text.config(state='disabled')
+        self.message_button.config(fg=color)
+        
+        # Center dialog; its size is fixed, so no layout pass is needed
+        x = self.root.winfo_x() + (self.root.winfo_width() - 600) // 2
+        y = self.root.winfo_y() + (self.root.winfo_height() - 400) // 2
+        dialog.geometry(f"600x400+{x}+{y}")
+        dialog.deiconify()
+        dialog.lift()
+        dialog.grab_set()
+    
+    def build_message_dialog(self):
+        """Create the hidden message dialog reused by show_message"""
+        dialog = self.message_dialog = tk.Toplevel(self.root)
+        dialog.withdraw()
         dialog.configure(bg=self.colors['dark_bg'])
         dialog.transient(self.root)
-        dialog.grab_set()
+        # Closing only hides it, ready for the next message
+        dialog.protocol('WM_DELETE_WINDOW', self.hide_message)
         
         # Title with glowing effect
         title_frame = tk.Frame(dialog, bg=self.colors['dark_bg'])
         title_frame.pack(fill='x', pady=(20, 10))
         
-        tk.Label(title_frame,
-                text=f"[ {title} ]",
-                bg=self.colors['dark_bg'],
-                fg=self.colors[color_key],
-                font=('Orbitron', 16, 'bold')).pack()
+        self.message_title = tk.Label(title_frame,
+                                     bg=self.colors['dark_bg'],
+                                     font=('Orbitron', 16, 'bold'))
+        self.message_title.pack()
         
         # Message in scrolling text
         text_frame = tk.Frame(dialog, bg=self.colors['dark_bg'])
         text_frame.pack(fill='both', expand=True, padx=20, pady=10)
         
-        text_widget = scrolledtext.ScrolledText(text_frame,
-                                               bg='#000000',
-                                               fg=self.colors[color_key],
-                                               font=('Consolas', 10),
-                                               wrap='word',
-                                               insertbackground=self.colors[color_key])
-        text_widget.pack(fill='both', expand=True)
-        text_widget.insert('1.0', message)
-        text_widget.config(state='disabled')
+        self.message_text = scrolledtext.ScrolledText(text_frame,
+                                                     bg='#000000',
+                                                     font=('Consolas', 10),
+                                                     wrap='word')
+        self.message_text.pack(fill='both', expand=True)
         
         # Button frame
         button_frame = tk.Frame(dialog, bg=self.colors['dark_bg'])
         button_frame.pack(fill='x', pady=20)
         
-        tk.Button(button_frame,
-                 text="[ CLOSE ]",
-                 command=dialog.destroy,
-                 bg=self.colors['darker_bg'],
-                 fg=self.colors[color_key],
-                 font=('Consolas', 10, 'bold'),
-                 padx=30,
-                 pady=10,
-                 cursor='hand2').pack()
-        
-        # Center dialog
-        dialog.update_idletasks()
-        x = self.root.winfo_x() + (self.root.winfo_width() - dialog.winfo_width()) // 2
-        y = self.root.winfo_y() + (self.root.winfo_height() - dialog.winfo_height()) // 2
-        dialog.geometry(f"+{x}+{y}")
+        self.message_button = tk.Button(button_frame,
+                                       text="[ CLOSE ]",
+                                       command=self.hide_message,
+                                       bg=self.colors['darker_bg'],
+                                       font=('Consolas', 10, 'bold'),
+                                       padx=30,
+                                       pady=10,
+                                       cursor='hand2')
+        self.message_button.pack()
+    
+    def hide_message(self):
+        """Close the message dialog (it is kept for the next message)"""
+        self.message_dialog.grab_release()
+        self.message_dialog.withdraw()
     
     def new_analysis(self):
         """Start new analysis session"""
@@ -1759,23 +2303,20 @@ RECOMMENDATIONS:
         self.password_entry.insert(0, "Enter password here...")
         self.password_entry.config(fg=self.colors['text_dim'])
         self.current_password = ""
-        self.status_bar.config(text=">_ NEW ANALYSIS SESSION STARTED")
+        self.set_status(">_ NEW ANALYSIS SESSION STARTED")
         
         # Reset UI elements
-        if hasattr(self, 'strength_bar'):
+        if self.strength_bar is not None:
             self.strength_bar.config(width=0, bg=self.colors['text_dim'])
-        
-        if hasattr(self, 'strength_label'):
             self.strength_label.config(text="ENTER PASSWORD TO BEGIN ANALYSIS", fg=self.colors['text_secondary'])
         
         for label in self.metric_labels.values():
             label.config(text="")
+        self._last_strength_bar = self._last_strength_text = self._last_strength_fg = None
+        self._last_metric_values = dict.fromkeys(self.metric_labels, "")
         
         # Update feed
-        self.feed_text.config(state='normal')
-        self.feed_text.insert('end', "> NEW ANALYSIS SESSION INITIALIZED\n")
-        self.feed_text.see('end')
-        self.feed_text.config(state='disabled')
+        self.log_feed("> NEW ANALYSIS SESSION INITIALIZED")
     
     def open_report(self):
         """Open report file"""
@@ -1800,8 +2341,9 @@ RECOMMENDATIONS:
                 'system': 'GRAE-X SENTINEL PRO v4.2.1'
             }
             try:
+                payload = json.dumps(data, indent=2)
                 with open(file_path, 'w') as f:
-                    json.dump(data, f, indent=2)
+                    f.write(payload)
                 self.show_message("EXPORT SUCCESS", f"ALL DATA EXPORTED TO:\n{file_path}", "matrix_green")
             except Exception as e:
                 self.show_message("EXPORT FAILED", f"ERROR:\n{str(e)}", "alert_red")
@@ -1829,150 +2371,38 @@ RECOMMENDATIONS:
     
     def show_guide(self):
         """Show user guide"""
-        guide = """GRAE-X SENTINEL PRO v4.2.1 USER GUIDE
-━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-
-CORE FEATURES:
-1. Password Strength Analyzer
-   - Real-time password analysis
-   - Entropy calculation
-   - Crack time estimation
-   - Security recommendations
-
-2. Network Security Scanner
-   - Wireless network detection
-   - Security protocol analysis
-   - Threat level assessment
-   - Vulnerability identification
-
-3. Cryptographic Key Generator
-   - Custom length passwords
-   - Character set selection
-   - Typewriter display effect
-   - Secure storage options
-
-4. Security Reports
-   - Comprehensive analytics
-   - Export capabilities
-   - Forensic analysis
-   - System diagnostics
-
-KEYBOARD SHORTCUTS:
-• F1: Password Analyzer
-• F2: Network Scanner
-• F3: Key Generator
-• F4: Security Reports
-• F5: Dashboard
-• Ctrl+N: New Session
-• Ctrl+S: Save Key
-• Ctrl+Q: Exit System
-
-SYSTEM REQUIREMENTS:
-• Windows 10/11, macOS, Linux
-• Python 3.8 or higher
-• 4GB RAM minimum
-• Network adapter (for scanning)
-• 500MB free disk space
-
-FOR SUPPORT:
-Contact: support@graex-security.com
-Website: https://graex-security.com
-Documentation: https://docs.graex-security.com"""
-        
-        self.show_message("USER GUIDE", guide, "matrix_green")
+        self.show_message("USER GUIDE", GUIDE_TEXT, "matrix_green")
     
     def show_shortcuts(self):
         """Show keyboard shortcuts"""
-        shortcuts = """KEYBOARD SHORTCUTS REFERENCE
-━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-
-NAVIGATION:
-• F1: Password Analyzer Tab
-• F2: Network Scanner Tab
-• F3: Key Generator Tab
-• F4: Security Reports Tab
-• F5: Dashboard Tab
-
-ACTIONS:
-• Ctrl+N: Start New Analysis Session
-• Ctrl+S: Save Current Key to Vault
-• Ctrl+Q: Exit Application
-• Space: Trigger Selected Button
-• Enter: Execute Current Operation
-
-QUICK ACCESS:
-• Tab: Navigate between fields
-• Shift+Tab: Navigate backwards
-• Esc: Close current dialog
-• Alt+F4: Close application
-
-SPECIAL FUNCTIONS:
-• Alt+M: Toggle Matrix Effect
-• Alt+T: Change Theme
-• Alt+H: Show Help
-• Alt+A: About System"""
-        
-        self.show_message("KEYBOARD SHORTCUTS", shortcuts, "cyber_blue")
+        self.show_message("KEYBOARD SHORTCUTS", SHORTCUTS_TEXT, "cyber_blue")
     
     def show_about(self):
         """Show about dialog"""
-        about = """GRAE-X SENTINEL PRO v4.2.1
-━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-
-ADVANCED CYBERSECURITY SUITE
-Futuristic Interface with Real-Time Analysis
-
-TECHNOLOGY STACK:
-• Quantum-Resistant Algorithms
-• Neural Network Threat Detection
-• Real-Time Security Analytics
-• Encrypted Data Storage
-• Advanced Forensic Tools
-
-FEATURES:
-✓ Matrix-Style Visual Interface
-✓ Real-Time Password Analysis
-✓ Wireless Network Security
-✓ Cryptographic Key Generation
-✓ Comprehensive Security Reports
-✓ System Monitoring Dashboard
-
-SECURITY PROTOCOLS:
-• AES-256 Encryption
-• SHA-3 Hashing
-• TLS 1.3 Communication
-• Zero-Knowledge Architecture
-• Multi-Factor Authentication
-
-WARNING:
-This software is for EDUCATIONAL and
-RESEARCH purposes only. Use responsibly
-and in compliance with all applicable laws.
-
-DEVELOPED BY:
-GRAE-X Security Research Division
-
-© 2024 GRAE-X SECURITY
-All Rights Reserved"""
-        
-        self.show_message("ABOUT GRAE-X SENTINEL", about, "alert_red")
+        self.show_message("ABOUT GRAE-X SENTINEL", ABOUT_TEXT, "alert_red")
     
-    def run(self):
-        """Run the application"""
-        # Center window on screen
-        self.root.update_idletasks()
-        width = self.root.winfo_width()
-        height = self.root.winfo_height()
+    def center_window(self):
+        """Center the main window on screen and show it"""
+        width, height = self.WINDOW_SIZE
         x = (self.root.winfo_screenwidth() // 2) - (width // 2)
         y = (self.root.winfo_screenheight() // 2) - (height // 2)
         self.root.geometry(f'{width}x{height}+{x}+{y}')
+        self.root.deiconify()
+    
+    def run(self):
+        """Run the application"""
+        # Center and show the window once the event loop has laid it out,
+        # instead of forcing a layout pass here
+        self.root.after_idle(self.center_window)
         
         # Start main loop
         self.root.mainloop()
+        
+        # Don't keep the process alive for queued background work
+        self.executor.shutdown(wait=False, cancel_futures=True)
 
-# Run the application
-if __name__ == "__main__":
-    print("""
+# Startup banner printed by __main__, encoded once
+STARTUP_BANNER = ("""
     ╔══════════════════════════════════════════════════════════════════╗
     ║                                                                  ║
     ║    ██████╗ ██████╗  █████╗ ███████╗    ███████╗███████╗███╗   ██╗║
@@ -1986,12 +2416,19 @@ if __name__ == "__main__":
     ║              Advanced Cybersecurity Suite                        ║
     ║                                                                  ║
     ╚══════════════════════════════════════════════════════════════════╝
-    """)
-    print("Initializing GRAE-X SENTINEL PRO v4.2.1...")
-    print("Loading Matrix Security Interface...")
-    print("System Security Protocols: ONLINE")
-    print("All Modules: ACTIVE")
-    print("Ready for Operation.\n")
+    
+Initializing GRAE-X SENTINEL PRO v4.2.1...
+Loading Matrix Security Interface...
+System Security Protocols: ONLINE
+All Modules: ACTIVE
+Ready for Operation.
+
+""").encode('utf-8')
+
+# Run the application
+if __name__ == "__main__":
+    sys.stdout.buffer.write(STARTUP_BANNER)
+    sys.stdout.flush()
     
     app = SentinelGUI()
     app.run()
\ No newline at end of file
@@ -214,7 +214,7 @@ class DigitalRainWidget:
 class SentinelGUI:
     """Main GUI Application - Matrix Edition"""
     
-        def __init__(self):
+    def __init__(self):
         self.root = tk.Tk()
         self.root.title("GRAE-X SENTINEL PRO // v4.2 // SYSTEM ONLINE")
         self.root.geometry("1400x900")
@@ -261,14 +261,6 @@ class SentinelGUI:
         
         # Create menu last
         self.setup_cyber_menu()
-        
-        # Initialize stats
-        self.stats = {
-            'passwords_analyzed': 0,
-            'networks_scanned': 0,
-            'breaches_found': 0,
-            'reports_generated': 0
-        }
     
     def setup_main_container(self):
         """Setup main container with cyberpunk styling"""
@@ -332,14 +324,18 @@ class SentinelGUI:
             ("DATABASE", "SECURE", self.colors['neon_purple']),
         ]
         
+        # The labels share one color, so they are a single multiline item;
+        # each status has its own color and is lined up with its label row
+        labels_item = title_canvas.create_text(status_x, 50,
+                                              text="\n".join(f"{label}:" for label, _, _ in indicators),
+                                              fill=self.colors['text_secondary'],
+                                              font=('Courier New', 10),
+                                              anchor='w')
+        _, top, _, bottom = title_canvas.bbox(labels_item)
+        line_height = (bottom - top) / len(indicators)
+        
         for i, (label, status, color) in enumerate(indicators):
-            y_pos = 25 + i * 25
-            title_canvas.create_text(status_x, y_pos,
-                                    text=f"{label}:",
-                                    fill=self.colors['text_secondary'],
-                                    font=('Courier New', 10),
-                                    anchor='w')
-            title_canvas.create_text(status_x + 80, y_pos,
+            title_canvas.create_text(status_x + 80, top + (i + 0.5) * line_height,
                                     text=f"[{status}]",
                                     fill=color,
                                     font=('Courier New', 10, 'bold'),
@@ -473,24 +469,28 @@ class SentinelGUI:
                                      outline='')
         
         # Percentage label
+        percent_var = tk.StringVar(value=f"{initial}%")
         percent_label = tk.Label(frame,
-                                text=f"{initial}%",
+                                textvariable=percent_var,
                                 bg=self.colors['panel_bg'],
                                 fg=self.colors['matrix_green'],
                                 font=('Courier New', 9))
         percent_label.pack(side='left', padx=5)
         
-        return {'canvas': canvas, 'bar': bar, 'label': percent_label}
+        # The numeric value is kept here, so updates never parse the label
+        return {'canvas': canvas, 'bar': bar, 'label': percent_label,
+                'var': percent_var, 'value': initial,
+                'color': self.colors['matrix_green']}
     
     def update_system_monitor(self):
         """Update system monitor with random values"""
         for bar_info in [self.cpu_bar, self.ram_bar, self.net_bar]:
-            current = int(bar_info['label'].cget('text').replace('%', ''))
             change = random.randint(-10, 10)
-            new_value = max(0, min(100, current + change))
+            new_value = max(0, min(100, bar_info['value'] + change))
+            bar_info['value'] = new_value
             
             bar_info['canvas'].coords(bar_info['bar'], 0, 0, new_value * 1.5, 15)
-            bar_info['label'].config(text=f"{new_value}%")
+            bar_info['var'].set(f"{new_value}%")
             
             # Change color based on usage
             if new_value > 80:
@@ -500,7 +500,9 @@ class SentinelGUI:
             else:
                 color = self.colors['matrix_green']
             
-            bar_info['canvas'].itemconfig(bar_info['bar'], fill=color)
+            if color != bar_info['color']:
+                bar_info['canvas'].itemconfig(bar_info['bar'], fill=color)
+                bar_info['color'] = color
         
         self.root.after(2000, self.update_system_monitor)
     
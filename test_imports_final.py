@@ -1,4 +1,6 @@
-﻿print("Testing imports after fix...")
+﻿from concurrent.futures import ThreadPoolExecutor
+
+print("Testing imports after fix...")
 print("=" * 50)
 
 imports_to_test = [
@@ -9,15 +11,22 @@ imports_to_test = [
     ("modules.password_analyzer", "PasswordAnalyzer"),
 ]
 
-for module_name, class_name in imports_to_test:
+def try_import(spec):
+    """Import one class and return its result line"""
+    module_name, class_name = spec
     try:
-        exec(f"from {module_name} import {class_name}")
-        print(f" {class_name} imported successfully")
+        exec(f"from {module_name} import {class_name}", {})
+        return f" {class_name} imported successfully"
     except ImportError as e:
-        print(f" {class_name}: ImportError - {e}")
+        return f" {class_name}: ImportError - {e}"
     except SyntaxError as e:
-        print(f" {class_name}: SyntaxError - {e}")
+        return f" {class_name}: SyntaxError - {e}"
     except Exception as e:
-        print(f" {class_name}: {type(e).__name__} - {e}")
+        return f" {class_name}: {type(e).__name__} - {e}"
+
+# Imports run side by side; map() still yields results in list order
+with ThreadPoolExecutor(max_workers=len(imports_to_test)) as pool:
+    for line in pool.map(try_import, imports_to_test):
+        print(line)
 
 print("=" * 50)